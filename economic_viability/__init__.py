@@ -1,29 +1,32 @@
-from .project_manager import ProjectManager
-from .config import Config
-from .financial_calculations import FinancialCalculations
-from .excel_exporter import ExcelExporter
-from .financial_items import (
-    BaseFinancialItem,
-    CapExItem,
-    CapexManager,
-    OpExItem,
-    OpexManager,
-    ReceitaItem,
-    ReceitasManager
-)
+import importlib
 
 __version__ = '1.0.0'
 
-__all__ = [
-    'ProjectManager',
-    'Config',
-    'FinancialCalculations',
-    'ExcelExporter',
-    'BaseFinancialItem',
-    'CapExItem',
-    'CapexManager',
-    'OpExItem',
-    'OpexManager',
-    'ReceitaItem',
-    'ReceitasManager'
-]
+# Public names mapped to the submodule defining them, resolved lazily
+# (PEP 562) so importing the package does not pay for openpyxl/numpy
+# until a consumer actually touches something that needs them
+_LAZY_IMPORTS = {
+    'ProjectManager': '.project_manager',
+    'Config': '.config',
+    'FinancialCalculations': '.financial_calculations',
+    'ExcelExporter': '.excel_exporter',
+    'BaseFinancialItem': '.financial_items',
+    'CapExItem': '.financial_items',
+    'CapexManager': '.financial_items',
+    'OpExItem': '.financial_items',
+    'OpexManager': '.financial_items',
+    'ReceitaItem': '.financial_items',
+    'ReceitasManager': '.financial_items'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name):
+    """Resolve public names on first access and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
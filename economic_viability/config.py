@@ -1,6 +1,15 @@
 import json
-import os
+import time
 from datetime import datetime
+from .excel_utils import reset_sheet
+
+# Worksheet labels mapped to Config attribute names, used when parsing
+# the configuration sheet
+_LABEL_MAP = {
+    "TMA (%)": "tma",
+    "IR (%)": "ir",
+    "CSLL (%)": "csll"
+}
 
 class Config:
     def __init__(self):
@@ -8,7 +17,8 @@ class Config:
         self.tma = 0.0  # Taxa Mínima de Atratividade (%)
         self.ir = 0.0   # Imposto de Renda (%)
         self.csll = 0.0 # Contribuição Social sobre Lucro Líquido (%)
-        self.modified_at = datetime.now()
+        self._tax_fraction = 0.0
+        self._modified_ns = time.time_ns()
 
     def update(self, tma=None, ir=None, csll=None):
         """
@@ -23,25 +33,33 @@ class Config:
             tuple: (bool, str) - (success, message)
         """
         try:
+            # Validate every input before assigning any, so a rejected
+            # update leaves the config (and the cached tax fraction)
+            # exactly as it was
             if tma is not None:
                 tma_value = float(tma)
                 if tma_value < 0 or tma_value > 100:
                     return False, "TMA deve estar entre 0 e 100%"
-                self.tma = tma_value
 
             if ir is not None:
                 ir_value = float(ir)
                 if ir_value < 0 or ir_value > 100:
                     return False, "IR deve estar entre 0 e 100%"
-                self.ir = ir_value
 
             if csll is not None:
                 csll_value = float(csll)
                 if csll_value < 0 or csll_value > 100:
                     return False, "CSLL deve estar entre 0 e 100%"
+
+            if tma is not None:
+                self.tma = tma_value
+            if ir is not None:
+                self.ir = ir_value
+            if csll is not None:
                 self.csll = csll_value
 
-            self.modified_at = datetime.now()
+            self._tax_fraction = (self.ir + self.csll) / 100
+            self._modified_ns = time.time_ns()
             return True, "Configurações atualizadas com sucesso"
 
         except ValueError:
@@ -49,6 +67,21 @@ class Config:
         except Exception as e:
             return False, f"Erro ao atualizar configurações: {str(e)}"
 
+    @property
+    def modified_at(self):
+        """
+        Last modification time as a datetime.
+
+        Internally only a nanosecond stamp from time.time_ns() is kept;
+        the datetime object is built lazily on access so hot update
+        paths skip the allocation.
+        """
+        return datetime.fromtimestamp(self._modified_ns / 1e9)
+
+    @modified_at.setter
+    def modified_at(self, value):
+        self._modified_ns = int(value.timestamp() * 1e9)
+
     def get_effective_tax_rate(self):
         """
         Calculate the effective combined tax rate.
@@ -58,6 +91,19 @@ class Config:
         """
         return self.ir + self.csll
 
+    @property
+    def effective_tax_fraction(self):
+        """
+        Get the effective combined tax rate as a fraction (0-1).
+
+        Cached on update() so hot calculation paths avoid redoing the
+        addition and division on every access.
+
+        Returns:
+            float: Combined tax rate as a fraction
+        """
+        return self._tax_fraction
+
     def to_dict(self):
         """
         Convert configuration to dictionary.
@@ -108,8 +154,10 @@ class Config:
             tuple: (bool, str) - (success, message)
         """
         try:
+            # Serialize first so a single write() carries the whole payload
+            payload = json.dumps(self.to_dict(), indent=4)
             with open(filepath, 'w') as f:
-                json.dump(self.to_dict(), f, indent=4)
+                f.write(payload)
             return True, "Configurações salvas com sucesso"
         except Exception as e:
             return False, f"Erro ao salvar configurações: {str(e)}"
@@ -125,14 +173,14 @@ class Config:
             tuple: (bool, str) - (success, message)
         """
         try:
-            if not os.path.exists(filepath):
-                return False, "Arquivo de configuração não encontrado"
-                
+            # Open directly (EAFP): avoids a separate stat and a TOCTOU race
             with open(filepath, 'r') as f:
-                data = json.load(f)
-            
+                data = json.loads(f.read())
+
             return self.from_dict(data)
-            
+
+        except FileNotFoundError:
+            return False, "Arquivo de configuração não encontrado"
         except json.JSONDecodeError:
             return False, "Arquivo de configuração inválido"
         except Exception as e:
@@ -150,15 +198,7 @@ class Config:
             tuple: (bool, str) - (success, message)
         """
         try:
-            if sheet_name in workbook.sheetnames:
-                ws = workbook[sheet_name]
-            else:
-                ws = workbook.create_sheet(sheet_name)
-
-            # Clear existing content
-            for row in ws.rows:
-                for cell in row:
-                    cell.value = None
+            ws = reset_sheet(workbook, sheet_name)
 
             # Write headers and values
             ws.append(["Parâmetro", "Valor"])
@@ -173,14 +213,35 @@ class Config:
         except Exception as e:
             return False, f"Erro ao exportar configurações: {str(e)}"
 
+    @classmethod
+    def load_workbook_for_read(cls, filepath):
+        """
+        Open a workbook for parsing only.
+
+        read_only mode streams rows from disk instead of building the
+        full cell tree, and data_only resolves formulas to their cached
+        values. Callers feeding load_from_excel should open workbooks
+        through this helper.
+
+        Args:
+            filepath (str): Path to the Excel file
+
+        Returns:
+            Workbook: Read-only openpyxl workbook
+        """
+        from openpyxl import load_workbook
+        return load_workbook(filepath, read_only=True, data_only=True)
+
     def load_from_excel(self, workbook, sheet_name="Configuração"):
         """
         Load configuration from an Excel worksheet.
-        
+
         Args:
-            workbook: openpyxl workbook object
+            workbook: openpyxl workbook object, preferably opened via
+                      load_workbook_for_read (values are accessed
+                      read-only, so a streaming workbook is enough)
             sheet_name (str): Name of the worksheet
-            
+
         Returns:
             tuple: (bool, str) - (success, message)
         """
@@ -189,16 +250,13 @@ class Config:
                 return False, "Planilha de configuração não encontrada"
 
             ws = workbook[sheet_name]
-            data = {}
 
             # Read values (assuming specific row positions)
-            for row in ws.iter_rows(min_row=2, max_row=4, values_only=True):
-                if row[0] == "TMA (%)":
-                    data["tma"] = float(row[1] or 0)
-                elif row[0] == "IR (%)":
-                    data["ir"] = float(row[1] or 0)
-                elif row[0] == "CSLL (%)":
-                    data["csll"] = float(row[1] or 0)
+            data = {
+                key: float(row[1] or 0)
+                for row in ws.iter_rows(min_row=2, max_row=4, values_only=True)
+                if (key := _LABEL_MAP.get(row[0]))
+            }
 
             return self.from_dict(data)
             
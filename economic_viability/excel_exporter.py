@@ -1,14 +1,30 @@
+from collections import defaultdict
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from datetime import datetime
 
 class ExcelExporter:
-    def __init__(self, project_manager, capex_manager, opex_manager, 
+    # Shared style singletons: one allocation for the whole export
+    # instead of one per styled cell
+    _TITLE_FONT = Font(size=14, bold=True)
+    _TITLE_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+    _HEADER_FONT = Font(bold=True)
+    _HEADER_FILL = PatternFill(start_color="EEEEEE", end_color="EEEEEE", fill_type="solid")
+    _HEADER_BORDER = Border(
+        bottom=Side(style='thin'),
+        top=Side(style='thin'),
+        left=Side(style='thin'),
+        right=Side(style='thin')
+    )
+    _HEADER_ALIGN = Alignment(horizontal="center")
+
+    def __init__(self, project_manager, capex_manager, opex_manager,
                  receitas_manager, config, financial_calculations):
         """
         Initialize Excel Exporter with all required managers.
-        
+
         Args:
             project_manager: Instance of ProjectManager
             capex_manager: Instance of CapexManager
@@ -23,24 +39,24 @@ class ExcelExporter:
         self.receitas_manager = receitas_manager
         self.config = config
         self.financial_calculations = financial_calculations
+        self._col_widths = defaultdict(int)
 
     def export_project(self, filepath):
         """
         Export all project data to an Excel file.
-        
+
+        The workbook is created in write-only mode so rows are streamed
+        straight to XML instead of being kept as in-memory Cell objects.
+
         Args:
             filepath (str): Path where the Excel file will be saved
-            
+
         Returns:
             tuple: (bool, str) - (success, message)
         """
         try:
-            wb = Workbook()
-            
-            # Remove default sheet
-            if "Sheet" in wb.sheetnames:
-                wb.remove(wb["Sheet"])
-            
+            wb = Workbook(write_only=True)
+
             # Create and style all sheets
             self._create_summary_sheet(wb)
             self._create_capex_sheet(wb)
@@ -48,189 +64,271 @@ class ExcelExporter:
             self._create_receitas_sheet(wb)
             self._create_config_sheet(wb)
             self._create_results_sheet(wb)
-            
+
             # Save workbook
             wb.save(filepath)
             return True, "Projeto exportado com sucesso"
-            
+
         except Exception as e:
             return False, f"Erro ao exportar projeto: {str(e)}"
 
+    def export_results(self, filepath):
+        """
+        Export only the results sheet to an Excel file.
+
+        Uses xlsxwriter in constant-memory mode when available, so each
+        cash-flow row goes straight to disk instead of through a Python
+        cell object. Falls back to the write-only openpyxl path when
+        xlsxwriter is not installed.
+
+        Args:
+            filepath (str): Path where the Excel file will be saved
+
+        Returns:
+            tuple: (bool, str) - (success, message)
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            try:
+                wb = Workbook(write_only=True)
+                self._create_results_sheet(wb)
+                wb.save(filepath)
+                return True, "Resultados exportados com sucesso"
+            except Exception as e:
+                return False, f"Erro ao exportar resultados: {str(e)}"
+
+        try:
+            wb = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+            ws = wb.add_worksheet("Resultados")
+
+            title_format = wb.add_format({"bold": True, "font_size": 14, "bg_color": "#CCCCCC"})
+            header_format = wb.add_format({"bold": True, "bg_color": "#EEEEEE",
+                                           "border": 1, "align": "center"})
+
+            row = 0
+            ws.write(row, 0, "Resultados da Análise", title_format)
+            row += 2
+
+            # Financial indicators
+            ws.write_row(row, 0, ["Indicador", "Valor"], header_format)
+            row += 1
+            formatted_results = self.financial_calculations.format_results()
+            for label, key in (("TIR", "tir"), ("VPL", "vpl"),
+                               ("Payback", "payback"), ("Dívida/EBITDA", "divida_ebitda")):
+                ws.write_row(row, 0, [label, formatted_results[key]])
+                row += 1
+
+            # Cash flow table
+            row += 1
+            ws.write(row, 0, "Fluxo de Caixa Mensal")
+            row += 1
+            ws.write_row(row, 0, ["Mês", "Receitas", "OpEx", "CapEx",
+                                  "EBITDA", "Impostos", "Fluxo Líquido"], header_format)
+            row += 1
+
+            soa = self.financial_calculations.results.get("cash_flows_soa")
+            if soa is not None:
+                keys = ("month", "revenue", "opex", "capex", "ebitda", "taxes", "net_cash_flow")
+                columns = [soa[key].tolist() for key in keys]
+                for values in zip(*columns):
+                    ws.write_row(row, 0, values)
+                    row += 1
+
+            wb.close()
+            return True, "Resultados exportados com sucesso"
+
+        except Exception as e:
+            return False, f"Erro ao exportar resultados: {str(e)}"
+
     def _create_summary_sheet(self, wb):
         """Create and populate the summary sheet."""
         ws = wb.create_sheet("Resumo")
-        self._apply_header_style(ws, "Resumo do Projeto")
-        
+
+        rows = []
+
         # Project information
         current_project = self.project_manager.get_current_project()
         if current_project and "metadata" in current_project:
             metadata = current_project["metadata"]
-            ws.append(["Nome do Projeto", metadata.get("name", "N/A")])
-            ws.append(["Descrição", metadata.get("description", "N/A")])
-            ws.append(["Data de Criação", metadata.get("created_at", "N/A")])
-            ws.append(["Última Modificação", metadata.get("last_modified", "N/A")])
-        
-        ws.append([])  # Empty row
-        
+            self._buffer_row(rows, ["Nome do Projeto", metadata.get("name", "N/A")])
+            self._buffer_row(rows, ["Descrição", metadata.get("description", "N/A")])
+            self._buffer_row(rows, ["Data de Criação", metadata.get("created_at", "N/A")])
+            self._buffer_row(rows, ["Última Modificação", metadata.get("last_modified", "N/A")])
+
+        rows.append([])  # Empty row
+
         # Summary of financial items
-        ws.append(["Resumo Financeiro"])
-        ws.append(["Categoria", "Quantidade de Itens", "Valor Total"])
-        ws.append(["CapEx", len(self.capex_manager.items), self.capex_manager.total_investment])
-        ws.append(["OpEx", len(self.opex_manager.items), self.opex_manager.total_annual_cost])
-        ws.append(["Receitas", len(self.receitas_manager.items), self.receitas_manager.total_annual_revenue])
-        
-        self._auto_adjust_columns(ws)
+        self._buffer_row(rows, ["Resumo Financeiro"])
+        self._buffer_row(rows, ["Categoria", "Quantidade de Itens", "Valor Total"])
+        self._buffer_row(rows, ["CapEx", len(self.capex_manager.items), self.capex_manager.total_investment])
+        self._buffer_row(rows, ["OpEx", len(self.opex_manager.items), self.opex_manager.total_annual_cost])
+        self._buffer_row(rows, ["Receitas", len(self.receitas_manager.items), self.receitas_manager.total_annual_revenue])
+
+        self._finalize_widths(ws)
+        self._write_title(ws, "Resumo do Projeto")
+        self._append_block(ws, rows)
 
     def _create_capex_sheet(self, wb):
         """Create and populate the CapEx sheet."""
         ws = wb.create_sheet("CapEx")
-        self._apply_header_style(ws, "Capital Expenditure (CapEx)")
-        
-        # Headers
+
         headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total", "Mês"]
-        ws.append(headers)
-        self._apply_column_headers_style(ws, headers)
-        
-        # Data
+        self._buffer_row([], headers)
+
+        rows = []
         for item in self.capex_manager.get_all_items():
-            ws.append(item.to_row())
-        
+            self._buffer_row(rows, item.to_row())
+
         # Total
-        ws.append([])
-        ws.append(["Total CapEx", "", "", "", self.capex_manager.total_investment])
-        
-        self._auto_adjust_columns(ws)
+        rows.append([])
+        self._buffer_row(rows, ["Total CapEx", "", "", "", self.capex_manager.total_investment])
+
+        self._finalize_widths(ws)
+        self._write_title(ws, "Capital Expenditure (CapEx)")
+        self._write_headers(ws, headers)
+        self._append_block(ws, rows)
 
     def _create_opex_sheet(self, wb):
         """Create and populate the OpEx sheet."""
         ws = wb.create_sheet("OpEx")
-        self._apply_header_style(ws, "Operational Expenditure (OpEx)")
-        
-        # Headers
+
         headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total",
                   "Recorrente", "Mês Inicial", "Mês Final"]
-        ws.append(headers)
-        self._apply_column_headers_style(ws, headers)
-        
-        # Data
+        self._buffer_row([], headers)
+
+        rows = []
         for item in self.opex_manager.get_all_items():
-            ws.append(item.to_row())
-        
+            self._buffer_row(rows, item.to_row())
+
         # Total
-        ws.append([])
-        ws.append(["Total OpEx Anual", "", "", "", self.opex_manager.total_annual_cost])
-        
-        self._auto_adjust_columns(ws)
+        rows.append([])
+        self._buffer_row(rows, ["Total OpEx Anual", "", "", "", self.opex_manager.total_annual_cost])
+
+        self._finalize_widths(ws)
+        self._write_title(ws, "Operational Expenditure (OpEx)")
+        self._write_headers(ws, headers)
+        self._append_block(ws, rows)
 
     def _create_receitas_sheet(self, wb):
         """Create and populate the Receitas sheet."""
         ws = wb.create_sheet("Receitas")
-        self._apply_header_style(ws, "Receitas")
-        
-        # Headers
+
         headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total",
                   "Recorrente", "Mês Inicial", "Mês Final", "Taxa de Crescimento (%)"]
-        ws.append(headers)
-        self._apply_column_headers_style(ws, headers)
-        
-        # Data
+        self._buffer_row([], headers)
+
+        rows = []
         for item in self.receitas_manager.get_all_items():
-            ws.append(item.to_row())
-        
+            self._buffer_row(rows, item.to_row())
+
         # Total
-        ws.append([])
-        ws.append(["Total Receitas Anual", "", "", "", self.receitas_manager.total_annual_revenue])
-        
-        self._auto_adjust_columns(ws)
+        rows.append([])
+        self._buffer_row(rows, ["Total Receitas Anual", "", "", "", self.receitas_manager.total_annual_revenue])
+
+        self._finalize_widths(ws)
+        self._write_title(ws, "Receitas")
+        self._write_headers(ws, headers)
+        self._append_block(ws, rows)
 
     def _create_config_sheet(self, wb):
         """Create and populate the configuration sheet."""
         ws = wb.create_sheet("Configuração")
-        self._apply_header_style(ws, "Configurações do Projeto")
-        
-        # Tax and TMA configuration
-        ws.append(["Parâmetro", "Valor"])
-        self._apply_column_headers_style(ws, ["Parâmetro", "Valor"])
-        
-        ws.append(["TMA (%)", self.config.tma])
-        ws.append(["IR (%)", self.config.ir])
-        ws.append(["CSLL (%)", self.config.csll])
-        ws.append(["Taxa Efetiva (%)", self.config.get_effective_tax_rate()])
-        
-        self._auto_adjust_columns(ws)
+
+        headers = ["Parâmetro", "Valor"]
+        self._buffer_row([], headers)
+
+        rows = []
+        self._buffer_row(rows, ["TMA (%)", self.config.tma])
+        self._buffer_row(rows, ["IR (%)", self.config.ir])
+        self._buffer_row(rows, ["CSLL (%)", self.config.csll])
+        self._buffer_row(rows, ["Taxa Efetiva (%)", self.config.get_effective_tax_rate()])
+
+        self._finalize_widths(ws)
+        self._write_title(ws, "Configurações do Projeto")
+        self._write_headers(ws, headers)
+        self._append_block(ws, rows)
 
     def _create_results_sheet(self, wb):
         """Create and populate the results sheet."""
         ws = wb.create_sheet("Resultados")
-        self._apply_header_style(ws, "Resultados da Análise")
-        
+
         # Financial indicators
-        ws.append(["Indicador", "Valor"])
-        self._apply_column_headers_style(ws, ["Indicador", "Valor"])
-        
         formatted_results = self.financial_calculations.format_results()
-        ws.append(["TIR", formatted_results["tir"]])
-        ws.append(["VPL", formatted_results["vpl"]])
-        ws.append(["Payback", formatted_results["payback"]])
-        ws.append(["Dívida/EBITDA", formatted_results["divida_ebitda"]])
-        
+        indicator_rows = []
+        self._buffer_row(indicator_rows, ["TIR", formatted_results["tir"]])
+        self._buffer_row(indicator_rows, ["VPL", formatted_results["vpl"]])
+        self._buffer_row(indicator_rows, ["Payback", formatted_results["payback"]])
+        self._buffer_row(indicator_rows, ["Dívida/EBITDA", formatted_results["divida_ebitda"]])
+
         # Cash flow table
+        cf_headers = ["Mês", "Receitas", "OpEx", "CapEx", "EBITDA", "Impostos", "Fluxo Líquido"]
+        self._buffer_row([], cf_headers)
+
+        cf_rows = []
+        for row in self.financial_calculations._soa_to_rows():
+            self._buffer_row(cf_rows, row)
+
+        self._finalize_widths(ws)
+        self._write_title(ws, "Resultados da Análise")
+        self._write_headers(ws, ["Indicador", "Valor"])
+        self._append_block(ws, indicator_rows)
+
         ws.append([])
         ws.append(["Fluxo de Caixa Mensal"])
-        
-        headers = ["Mês", "Receitas", "OpEx", "CapEx", "EBITDA", "Impostos", "Fluxo Líquido"]
-        ws.append(headers)
-        self._apply_column_headers_style(ws, headers)
-        
-        if "cash_flows" in self.financial_calculations.results:
-            for cf in self.financial_calculations.results["cash_flows"]:
-                ws.append([
-                    cf["month"],
-                    cf["revenue"],
-                    cf["opex"],
-                    cf["capex"],
-                    cf["ebitda"],
-                    cf["taxes"],
-                    cf["net_cash_flow"]
-                ])
-        
-        self._auto_adjust_columns(ws)
-
-    def _apply_header_style(self, ws, title):
-        """Apply style to sheet header."""
-        ws.append([title])
-        header_cell = ws["A1"]
-        header_cell.font = Font(size=14, bold=True)
-        header_cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-        ws.append([])  # Empty row after header
-
-    def _apply_column_headers_style(self, ws, headers):
-        """Apply style to column headers."""
-        row_num = ws.max_row
-        for col, _ in enumerate(headers, 1):
-            cell = ws.cell(row=row_num, column=col)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="EEEEEE", end_color="EEEEEE", fill_type="solid")
-            cell.border = Border(
-                bottom=Side(style='thin'),
-                top=Side(style='thin'),
-                left=Side(style='thin'),
-                right=Side(style='thin')
-            )
-            cell.alignment = Alignment(horizontal="center")
-
-    def _auto_adjust_columns(self, ws):
-        """Adjust column widths based on content."""
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            
-            adjusted_width = (max_length + 2)
-            ws.column_dimensions[column].width = adjusted_width
+        self._write_headers(ws, cf_headers)
+        self._append_block(ws, cf_rows)
+
+    def _write_title(self, ws, title):
+        """Write the styled sheet title followed by an empty row."""
+        cell = WriteOnlyCell(ws, value=title)
+        cell.font = self._TITLE_FONT
+        cell.fill = self._TITLE_FILL
+        ws.append([cell])
+        ws.append([])  # Empty row after title
+
+    def _write_headers(self, ws, headers):
+        """Write a styled column-header row."""
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = self._HEADER_FONT
+            cell.fill = self._HEADER_FILL
+            cell.border = self._HEADER_BORDER
+            cell.alignment = self._HEADER_ALIGN
+            cells.append(cell)
+        ws.append(cells)
+
+    def _append_block(self, ws, rows):
+        """Append a block of buffered rows with the bound append hoisted."""
+        append = ws.append
+        for row in rows:
+            append(row)
+
+    def _buffer_row(self, rows, row):
+        """
+        Buffer a row and fold its cell widths into the running maxima.
+
+        Measuring while the row is built avoids a second full pass over
+        the sheet data just to size columns.
+        """
+        widths = self._col_widths
+        for col_idx, value in enumerate(row, 1):
+            length = len(str(value))
+            if length > widths[col_idx]:
+                widths[col_idx] = length
+        rows.append(row)
+
+    def _finalize_widths(self, ws):
+        """
+        Apply the tracked width maxima to the sheet and reset the tracker.
+
+        Write-only sheets require dimensions to be set before any row is
+        appended, so this runs after buffering and before the writes.
+        Only the tracked column indices are touched; no sheet cells are
+        ever materialized to measure widths.
+        """
+        for col_idx in sorted(self._col_widths):
+            letter = get_column_letter(col_idx)
+            ws.column_dimensions[letter].width = self._col_widths[col_idx] + 2
+        self._col_widths.clear()
@@ -0,0 +1,60 @@
+"""Shared helpers for working with openpyxl workbooks."""
+
+from openpyxl import load_workbook
+
+# python-calamine reads xlsx in Rust and is several times faster than
+# openpyxl's XML parsing; fall back transparently when not installed
+try:
+    from python_calamine import CalamineWorkbook
+    HAVE_CALAMINE = True
+except ImportError:
+    HAVE_CALAMINE = False
+
+def iter_data_rows(filepath):
+    """
+    Yield plain value rows past the header of a workbook's first sheet.
+
+    Uses the calamine reader when python-calamine is installed and
+    openpyxl's read-only streaming otherwise; either way no Cell
+    objects are materialized and the workbook is released when the
+    iteration finishes.
+
+    Args:
+        filepath (str): Path to the Excel file
+
+    Yields:
+        tuple: Cell values of one data row
+    """
+    if HAVE_CALAMINE:
+        sheet = CalamineWorkbook.from_path(filepath).get_sheet_by_index(0)
+        rows = iter(sheet.to_python())
+        next(rows, None)  # skip the header row
+        yield from rows
+        return
+
+    wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        yield from wb.active.iter_rows(min_row=2, values_only=True)
+    finally:
+        wb.close()
+
+def reset_sheet(workbook, sheet_name):
+    """
+    Return an empty worksheet with the given name.
+
+    Removing and recreating the sheet is O(1) regardless of how many
+    cells it held, unlike clearing every cell in place. The sheet's
+    position in the workbook is preserved.
+
+    Args:
+        workbook: openpyxl workbook object
+        sheet_name (str): Name of the worksheet
+
+    Returns:
+        Worksheet: The freshly created worksheet
+    """
+    if sheet_name in workbook.sheetnames:
+        index = workbook.sheetnames.index(sheet_name)
+        workbook.remove(workbook[sheet_name])
+        return workbook.create_sheet(sheet_name, index)
+    return workbook.create_sheet(sheet_name)
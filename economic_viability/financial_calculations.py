@@ -1,5 +1,98 @@
+import time
 import numpy as np
-from datetime import datetime
+from .excel_utils import reset_sheet
+from .jit import njit, prange, HAVE_NUMBA
+
+@njit(cache=True)
+def _vpl_kernel(flows, discounts):
+    """
+    NPV of the flows against precomputed per-period discount factors.
+
+    Args:
+        flows (numpy.ndarray): Net cash flow per period
+        discounts (numpy.ndarray): 1/(1+rate)**t factors, same length
+
+    Returns:
+        float: Net present value
+    """
+    return np.dot(flows, discounts)
+
+@njit(cache=True)
+def _payback_kernel(flows):
+    """
+    Payback period in months, interpolated within the break-even month.
+
+    Args:
+        flows (numpy.ndarray): Net cash flow per period
+
+    Returns:
+        float: Payback period, or NaN if never reached
+    """
+    cum = np.cumsum(flows)
+    positive = np.where(cum >= 0)[0]
+    if positive.size == 0:
+        return np.nan
+    i = positive[0]
+    if i == 0:
+        return 1.0
+    prev = cum[i] - flows[i]
+    return i + (-prev / flows[i])
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _npv_sweep_kernel(flows, monthly_rates):
+    """
+    NPV of the flows at each rate of a sensitivity grid.
+
+    Compiled with parallel=True the outer loop runs one rate per
+    thread; the no-numba path uses the broadcast fallback instead.
+
+    Args:
+        flows (numpy.ndarray): Net cash flow per period
+        monthly_rates (numpy.ndarray): Monthly discount rates to sweep
+
+    Returns:
+        numpy.ndarray: NPV per rate, same length as monthly_rates
+    """
+    out = np.empty(monthly_rates.shape[0])
+    for i in prange(monthly_rates.shape[0]):
+        acc = 0.0
+        factor = 1.0
+        for t in range(flows.shape[0]):
+            factor /= 1.0 + monthly_rates[i]
+            acc += flows[t] * factor
+        out[i] = acc
+    return out
+
+def _irr_newton(flows, guess=0.1, tol=1e-7, maxiter=50):
+    """
+    Calculate the periodic internal rate of return via Newton-Raphson.
+
+    Args:
+        flows (numpy.ndarray): Net cash flow per period
+        guess (float): Initial rate estimate
+        tol (float): Convergence tolerance on the NPV step
+        maxiter (int): Maximum number of iterations
+
+    Returns:
+        float: Periodic IRR, or None if the iteration does not converge
+    """
+    t = np.arange(len(flows))
+    r = guess
+
+    for _ in range(maxiter):
+        discount = (1 + r) ** t
+        npv = (flows / discount).sum()
+        dnpv = (-t * flows / discount / (1 + r)).sum()
+        if dnpv == 0:
+            return None
+        step = npv / dnpv
+        r -= step
+        if r <= -1 or not np.isfinite(r):
+            return None
+        if abs(step) < tol:
+            return r
+
+    return None
 
 class FinancialCalculations:
     def __init__(self, capex_manager, opex_manager, receitas_manager, config):
@@ -17,6 +110,8 @@ class FinancialCalculations:
         self.receitas_manager = receitas_manager
         self.config = config
         self.results = {}
+        self._discount_cache = {}
+        self._formatted_cache = (None, None)
 
     def calculate_all(self):
         """
@@ -26,17 +121,18 @@ class FinancialCalculations:
             dict: Dictionary containing all calculated indicators
         """
         try:
-            # Calculate cash flows
+            # Calculate cash flows as structure-of-arrays
             cash_flows = self.calculate_cash_flows()
-            
+
             # Calculate indicators
             self.results = {
-                "cash_flows": cash_flows,
+                "cash_flows_soa": cash_flows,
                 "tir": self.calculate_tir(cash_flows),
                 "vpl": self.calculate_vpl(cash_flows),
                 "payback": self.calculate_payback(cash_flows),
                 "divida_ebitda": self.calculate_divida_ebitda(cash_flows),
-                "calculated_at": datetime.now().isoformat()
+                "vpl_sensitivity": self.calculate_vpl_sensitivity(cash_flows),
+                "calculated_at": time.time_ns()
             }
             
             return True, "Cálculos realizados com sucesso", self.results
@@ -46,143 +142,208 @@ class FinancialCalculations:
 
     def calculate_cash_flows(self):
         """
-        Calculate monthly cash flows.
-        
+        Calculate monthly cash flows in a single vectorized pass.
+
         Returns:
-            list: List of monthly cash flows
+            dict: Structure-of-arrays with 12-element numpy arrays keyed by
+                  column name (month, revenue, opex, capex, ebitda, taxes,
+                  net_cash_flow)
         """
-        cash_flows = []
-        
-        for month in range(1, 13):
-            # Calculate revenues
-            revenue = self.receitas_manager.get_monthly_revenue(month)
-            
-            # Calculate operational costs
-            opex = self.opex_manager.get_monthly_cost(month)
-            
-            # Calculate capital expenditure
-            capex = self.capex_manager.get_monthly_investment(month)
-            
-            # Calculate EBITDA (Earnings Before Interest, Taxes, Depreciation, and Amortization)
-            ebitda = revenue - opex
-            
-            # Calculate taxes
-            tax_rate = self.config.get_effective_tax_rate() / 100
-            taxes = max(0, ebitda * tax_rate)
-            
-            # Calculate net cash flow
-            net_cash_flow = ebitda - taxes - capex
-            
-            cash_flows.append({
-                "month": month,
-                "revenue": revenue,
-                "opex": opex,
-                "capex": capex,
-                "ebitda": ebitda,
-                "taxes": taxes,
-                "net_cash_flow": net_cash_flow
-            })
-            
-        return cash_flows
+        # Fetch the monthly series from each manager in one call
+        revenue = self.receitas_manager.get_monthly_revenue_array()
+        opex = self.opex_manager.get_monthly_cost_array()
+        capex = self.capex_manager.get_monthly_investment_array()
+
+        # Calculate EBITDA (Earnings Before Interest, Taxes, Depreciation, and Amortization)
+        ebitda = revenue - opex
+
+        # Calculate taxes
+        taxes = np.maximum(0.0, ebitda * self.config.effective_tax_fraction)
+
+        # Calculate net cash flow
+        net_cash_flow = ebitda - taxes - capex
+
+        return {
+            "month": np.arange(1, 13),
+            "revenue": revenue,
+            "opex": opex,
+            "capex": capex,
+            "ebitda": ebitda,
+            "taxes": taxes,
+            "net_cash_flow": net_cash_flow
+        }
+
+    def _soa_to_rows(self):
+        """
+        Materialize the SoA cash-flow arrays as a list of row lists.
+
+        The columns are stacked and converted in one C-level .tolist()
+        call instead of seven per-row key lookups.
+
+        Returns:
+            list: List of [month, revenue, opex, capex, ebitda, taxes,
+                  net_cash_flow] rows
+        """
+        soa = self.results.get("cash_flows_soa")
+        if soa is None:
+            return []
+
+        rows = np.column_stack([
+            soa["month"], soa["revenue"], soa["opex"], soa["capex"],
+            soa["ebitda"], soa["taxes"], soa["net_cash_flow"]
+        ]).tolist()
+
+        # column_stack promotes the month column to float; restore ints
+        for month, row in enumerate(rows, 1):
+            row[0] = month
+
+        return rows
 
     def calculate_tir(self, cash_flows):
         """
         Calculate TIR (Taxa Interna de Retorno / Internal Rate of Return).
-        
+
         Args:
-            cash_flows (list): List of monthly cash flows
-            
+            cash_flows (dict): Structure-of-arrays of monthly cash flows
+
         Returns:
             float: TIR value as percentage
         """
         try:
             # Extract net cash flows
-            flows = [cf["net_cash_flow"] for cf in cash_flows]
-            
-            # Calculate IRR using numpy
-            irr = np.irr(flows)
-            
+            flows = cash_flows["net_cash_flow"]
+
+            # Calculate monthly IRR via Newton-Raphson
+            irr = _irr_newton(flows)
+            if irr is None:
+                return None
+
             # Convert to annual rate and percentage
             annual_irr = ((1 + irr) ** 12 - 1) * 100
-            
+
             return annual_irr
-            
-        except Exception:
+
+        except (TypeError, ValueError, ZeroDivisionError):
             return None
 
     def calculate_vpl(self, cash_flows):
         """
         Calculate VPL (Valor Presente Líquido / Net Present Value).
-        
+
         Args:
-            cash_flows (list): List of monthly cash flows
-            
+            cash_flows (dict): Structure-of-arrays of monthly cash flows
+
         Returns:
             float: VPL value
         """
         try:
-            # Get monthly discount rate from TMA
+            net_flows = cash_flows["net_cash_flow"]
+
+            # Calculate NPV as a dot product with the cached discount factors
+            return _vpl_kernel(net_flows, self._get_discount_factors(len(net_flows)))
+
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+
+    def _get_discount_factors(self, n_periods):
+        """
+        Get the per-period discount factors derived from the TMA.
+
+        The vector is cached keyed on (tma, n_periods) so repeated
+        recalculations with an unchanged Config reuse the same array.
+
+        Args:
+            n_periods (int): Number of monthly periods
+
+        Returns:
+            numpy.ndarray: Array of 1/(1+rate)**t for t in 1..n_periods
+        """
+        key = (self.config.tma, n_periods)
+        factors = self._discount_cache.get(key)
+
+        if factors is None:
             monthly_rate = (1 + self.config.tma/100) ** (1/12) - 1
-            
-            # Calculate NPV
-            npv = 0
-            for i, cf in enumerate(cash_flows):
-                npv += cf["net_cash_flow"] / (1 + monthly_rate) ** (i + 1)
-                
-            return npv
-            
-        except Exception:
+            factors = 1.0 / (1 + monthly_rate) ** np.arange(1, n_periods + 1)
+            self._discount_cache[key] = factors
+
+        return factors
+
+    def calculate_vpl_sensitivity(self, cash_flows, spread=5.0, points=21):
+        """
+        Sweep the VPL over a grid of TMA rates around the configured one.
+
+        With numba installed the sweep runs in the parallel compiled
+        kernel, one rate per thread; otherwise a broadcast over a
+        (rates, periods) discount matrix computes all NPVs in one pass.
+
+        Args:
+            cash_flows (dict): Structure-of-arrays of monthly cash flows
+            spread (float): Percentage points swept either side of the TMA
+            points (int): Number of grid points
+
+        Returns:
+            dict: {"tma": rates, "vpl": values} numpy arrays, or None
+        """
+        try:
+            flows = cash_flows["net_cash_flow"]
+            tma = self.config.tma
+            rates = np.linspace(max(0.0, tma - spread), tma + spread, points)
+            monthly_rates = (1 + rates / 100) ** (1 / 12) - 1
+
+            if HAVE_NUMBA:
+                vpls = _npv_sweep_kernel(flows, monthly_rates)
+            else:
+                periods = np.arange(1, len(flows) + 1)
+                discounts = 1.0 / (1 + monthly_rates[:, None]) ** periods
+                vpls = discounts @ flows
+
+            return {"tma": rates, "vpl": vpls}
+
+        except (TypeError, ValueError, ZeroDivisionError):
             return None
 
     def calculate_payback(self, cash_flows):
         """
         Calculate Payback period.
-        
+
         Args:
-            cash_flows (list): List of monthly cash flows
-            
+            cash_flows (dict): Structure-of-arrays of monthly cash flows
+
         Returns:
             float: Payback period in months
         """
         try:
-            cumulative_flow = 0
-            for i, cf in enumerate(cash_flows):
-                cumulative_flow += cf["net_cash_flow"]
-                if cumulative_flow >= 0:
-                    # Interpolate for more precise payback period
-                    if i > 0:
-                        prev_cf = cumulative_flow - cf["net_cash_flow"]
-                        fraction = -prev_cf / cf["net_cash_flow"]
-                        return i + fraction
-                    return i + 1
-            return None  # Payback not achieved within the period
-            
-        except Exception:
+            payback = _payback_kernel(cash_flows["net_cash_flow"])
+            if np.isnan(payback):
+                return None  # Payback not achieved within the period
+            return payback
+
+        except (TypeError, ValueError, ZeroDivisionError):
             return None
 
     def calculate_divida_ebitda(self, cash_flows):
         """
         Calculate Dívida Líquida sobre EBITDA.
-        
+
         Args:
-            cash_flows (list): List of monthly cash flows
-            
+            cash_flows (dict): Structure-of-arrays of monthly cash flows
+
         Returns:
             float: Dívida Líquida/EBITDA ratio
         """
         try:
             # Calculate total EBITDA
-            total_ebitda = sum(cf["ebitda"] for cf in cash_flows)
+            total_ebitda = cash_flows["ebitda"].sum()
             if total_ebitda == 0:
                 return None
-            
+
             # Calculate net debt (assuming it's the negative of total capex)
-            total_capex = sum(cf["capex"] for cf in cash_flows)
+            total_capex = cash_flows["capex"].sum()
             
             # Calculate ratio
             return total_capex / total_ebitda if total_ebitda != 0 else None
-            
-        except Exception:
+
+        except (TypeError, ValueError, ZeroDivisionError):
             return None
 
     def format_results(self):
@@ -200,6 +361,12 @@ class FinancialCalculations:
                 "divida_ebitda": "N/A"
             }
 
+        # Results are only replaced wholesale by calculate_all, so the
+        # timestamp identifies the formatted output too
+        calculated_at = self.results.get("calculated_at")
+        if self._formatted_cache[0] == calculated_at:
+            return self._formatted_cache[1]
+
         # Format TIR
         tir = self.results.get("tir")
         tir_formatted = f"{tir:.2f}%" if tir is not None else "N/A"
@@ -221,12 +388,14 @@ class FinancialCalculations:
         divida_ebitda = self.results.get("divida_ebitda")
         divida_ebitda_formatted = f"{divida_ebitda:.2f}x" if divida_ebitda is not None else "N/A"
 
-        return {
+        formatted = {
             "tir": tir_formatted,
             "vpl": vpl_formatted,
             "payback": payback_formatted,
             "divida_ebitda": divida_ebitda_formatted
         }
+        self._formatted_cache = (calculated_at, formatted)
+        return formatted
 
     def export_to_excel(self, workbook):
         """
@@ -240,15 +409,7 @@ class FinancialCalculations:
         """
         try:
             # Create Results sheet
-            if "Resultados" in workbook.sheetnames:
-                ws = workbook["Resultados"]
-            else:
-                ws = workbook.create_sheet("Resultados")
-
-            # Clear existing content
-            for row in ws.rows:
-                for cell in row:
-                    cell.value = None
+            ws = reset_sheet(workbook, "Resultados")
 
             # Write indicators
             ws.append(["Indicador", "Valor"])
@@ -259,22 +420,24 @@ class FinancialCalculations:
             ws.append(["Dívida/EBITDA", formatted_results["divida_ebitda"]])
 
             # Add cash flows table if available
-            if "cash_flows" in self.results:
+            if "cash_flows_soa" in self.results:
                 ws.append([])  # Empty row
                 ws.append(["Fluxo de Caixa Mensal"])
                 headers = ["Mês", "Receitas", "OpEx", "CapEx", "EBITDA", "Impostos", "Fluxo Líquido"]
                 ws.append(headers)
 
-                for cf in self.results["cash_flows"]:
-                    ws.append([
-                        cf["month"],
-                        cf["revenue"],
-                        cf["opex"],
-                        cf["capex"],
-                        cf["ebitda"],
-                        cf["taxes"],
-                        cf["net_cash_flow"]
-                    ])
+                for row in self._soa_to_rows():
+                    ws.append(row)
+
+            # Add the VPL sensitivity sweep if available
+            sensitivity = self.results.get("vpl_sensitivity")
+            if sensitivity is not None:
+                ws.append([])  # Empty row
+                ws.append(["Sensibilidade VPL x TMA"])
+                ws.append(["TMA (%)", "VPL"])
+                for row in np.column_stack(
+                        [sensitivity["tma"], sensitivity["vpl"]]).tolist():
+                    ws.append(row)
 
             return True, "Resultados exportados com sucesso"
             
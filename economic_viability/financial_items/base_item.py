@@ -1,7 +1,30 @@
 from datetime import datetime
-import uuid
+import os
+import time
+
+# Shared randomness pool for TAG generation: one os.urandom syscall
+# hands out ~1000 tags' worth of 4-byte slices
+_TAG_PREFIX = "ITEM_"
+_TAG_BUF = b""
+_TAG_OFF = 0
+
+def _next_tag_bytes():
+    """Return the next 4 random bytes, refilling the pool when drained."""
+    global _TAG_BUF, _TAG_OFF
+    if _TAG_OFF + 4 > len(_TAG_BUF):
+        _TAG_BUF = os.urandom(4096)
+        _TAG_OFF = 0
+    chunk = _TAG_BUF[_TAG_OFF:_TAG_OFF + 4]
+    _TAG_OFF += 4
+    return chunk
 
 class BaseFinancialItem:
+    # Fixed attribute set: slots halve per-item memory and give direct
+    # descriptor access on the to_row/aggregation hot paths
+    __slots__ = ('tag', 'description', 'quantity', 'unit_price', 'total_value',
+                 '_created_ns', '_modified_ns', '_created_iso', '_modified_iso',
+                 '_valid_cache')
+
     def __init__(self, tag=None, description="", quantity=0, unit_price=0.0):
         """
         Initialize a base financial item.
@@ -16,22 +39,47 @@ class BaseFinancialItem:
         self.description = description
         self.quantity = float(quantity)
         self.unit_price = float(unit_price)
-        self.created_at = datetime.now()
-        self.modified_at = datetime.now()
+        self.total_value = self.quantity * self.unit_price
+        # Timestamps are kept as raw nanosecond ints; the datetime and
+        # ISO forms are materialized lazily on access
+        self._created_ns = time.time_ns()
+        self._modified_ns = self._created_ns
+        self._created_iso = None
+        self._modified_iso = None
+        self._recompute_validity()
 
     def _generate_tag(self):
         """Generate a unique TAG for the item."""
-        return f"ITEM_{str(uuid.uuid4())[:8]}"
+        return _TAG_PREFIX + _next_tag_bytes().hex()
+
+    @property
+    def created_at(self):
+        """Creation time as a datetime, built on demand."""
+        if self._created_ns is None:
+            self._created_ns = int(datetime.fromisoformat(self._created_iso).timestamp() * 1e9)
+        return datetime.fromtimestamp(self._created_ns / 1e9)
+
+    @created_at.setter
+    def created_at(self, value):
+        self._created_ns = int(value.timestamp() * 1e9)
+        self._created_iso = None
 
     @property
-    def total_value(self):
-        """Calculate the total value of the item."""
-        return self.quantity * self.unit_price
+    def modified_at(self):
+        """Last modification time as a datetime, built on demand."""
+        if self._modified_ns is None:
+            self._modified_ns = int(datetime.fromisoformat(self._modified_iso).timestamp() * 1e9)
+        return datetime.fromtimestamp(self._modified_ns / 1e9)
+
+    @modified_at.setter
+    def modified_at(self, value):
+        self._modified_ns = int(value.timestamp() * 1e9)
+        self._modified_iso = None
 
     def update(self, description=None, quantity=None, unit_price=None):
         """
         Update the item's attributes.
-        
+
         Args:
             description (str, optional): New description
             quantity (float, optional): New quantity
@@ -43,7 +91,10 @@ class BaseFinancialItem:
             self.quantity = float(quantity)
         if unit_price is not None:
             self.unit_price = float(unit_price)
-        self.modified_at = datetime.now()
+        self.total_value = self.quantity * self.unit_price
+        self._modified_ns = time.time_ns()
+        self._modified_iso = None
+        self._recompute_validity()
 
     def to_dict(self):
         """
@@ -52,14 +103,19 @@ class BaseFinancialItem:
         Returns:
             dict: Dictionary representation of the item
         """
+        if self._created_iso is None:
+            self._created_iso = self.created_at.isoformat()
+        if self._modified_iso is None:
+            self._modified_iso = self.modified_at.isoformat()
+
         return {
             "tag": self.tag,
             "description": self.description,
             "quantity": self.quantity,
             "unit_price": self.unit_price,
             "total_value": self.total_value,
-            "created_at": self.created_at.isoformat(),
-            "modified_at": self.modified_at.isoformat()
+            "created_at": self._created_iso,
+            "modified_at": self._modified_iso
         }
 
     def to_row(self):
@@ -94,28 +150,40 @@ class BaseFinancialItem:
             quantity=data.get("quantity", 0),
             unit_price=data.get("unit_price", 0.0)
         )
+        # Keep the raw ISO strings; the datetime forms are parsed lazily
+        # by the properties only if something actually asks for them
         if "created_at" in data:
-            item.created_at = datetime.fromisoformat(data["created_at"])
+            item._created_iso = data["created_at"]
+            item._created_ns = None
         if "modified_at" in data:
-            item.modified_at = datetime.fromisoformat(data["modified_at"])
+            item._modified_iso = data["modified_at"]
+            item._modified_ns = None
         return item
 
+    def _recompute_validity(self):
+        """Run the field checks once and cache the (is_valid, message) pair."""
+        if not self.tag:
+            self._valid_cache = (False, "TAG não pode estar vazio")
+        elif not self.description.strip():
+            self._valid_cache = (False, "Descrição não pode estar vazia")
+        elif self.quantity < 0:
+            self._valid_cache = (False, "Quantidade não pode ser negativa")
+        elif self.unit_price < 0:
+            self._valid_cache = (False, "Valor unitário não pode ser negativo")
+        else:
+            self._valid_cache = (True, "")
+
     def validate(self):
         """
         Validate the item's data.
-        
+
+        The checks run inside _recompute_validity whenever a field
+        changes; this just returns the cached result.
+
         Returns:
             tuple: (bool, str) - (is_valid, error_message)
         """
-        if not self.tag:
-            return False, "TAG não pode estar vazio"
-        if not self.description.strip():
-            return False, "Descrição não pode estar vazia"
-        if self.quantity < 0:
-            return False, "Quantidade não pode ser negativa"
-        if self.unit_price < 0:
-            return False, "Valor unitário não pode ser negativo"
-        return True, ""
+        return self._valid_cache
 
     def __str__(self):
         """String representation of the item."""
@@ -1,8 +1,17 @@
 from datetime import datetime
-from openpyxl import load_workbook
+import operator
+import sys
+import numpy as np
+from ..excel_utils import iter_data_rows
 from .base_item import BaseFinancialItem
 
+# Single C-level attribute fetch per item when serializing rows in bulk
+_CAPEX_ROW_FIELDS = operator.attrgetter(
+    'tag', 'description', 'quantity', 'unit_price', 'total_value', 'month')
+
 class CapExItem(BaseFinancialItem):
+    __slots__ = ('month',)
+
     def __init__(self, tag=None, description="", quantity=0, unit_price=0.0, month=1):
         """
         Initialize a CapEx item.
@@ -39,7 +48,30 @@ class CapexManager:
     def __init__(self):
         """Initialize the CapEx manager."""
         self.items = {}  # Dictionary to store items by TAG
-        self.total_investment = 0.0
+        self.total_investment = 0.0  # Maintained incrementally by mutators
+        self._version = 0
+        self._soa_cache = None
+        self._soa_cache_version = -1
+
+    def _get_soa(self):
+        """
+        Get (months, totals) arrays over all items.
+
+        Rebuilt only when the item set has changed since the last
+        access, tracked by a version counter bumped by every mutation.
+
+        Returns:
+            tuple: (months, totals) numpy arrays, one entry per item
+        """
+        if self._soa_cache_version != self._version:
+            items = list(self.items.values())
+            count = len(items)
+            self._soa_cache = (
+                np.fromiter((item.month for item in items), dtype=np.int64, count=count),
+                np.fromiter((item.total_value for item in items), dtype=np.float64, count=count)
+            )
+            self._soa_cache_version = self._version
+        return self._soa_cache
 
     def add_item(self, description, quantity, unit_price, month=1, tag=None):
         """
@@ -66,7 +98,8 @@ class CapexManager:
                 return False, "TAG já existe"
                 
             self.items[item.tag] = item
-            self._update_total()
+            self.total_investment += item.total_value
+            self._version += 1
             return True, "Item adicionado com sucesso"
             
         except Exception as e:
@@ -91,16 +124,19 @@ class CapexManager:
                 return False, "Item não encontrado"
                 
             item = self.items[tag]
+            old_total = item.total_value
             item.update(description, quantity, unit_price)
-            
+
             if month is not None:
                 item.month = max(1, min(12, int(month)))
-                
+
+            self.total_investment += item.total_value - old_total
+            self._version += 1
+
             is_valid, error_msg = item.validate()
             if not is_valid:
                 return False, error_msg
-                
-            self._update_total()
+
             return True, "Item atualizado com sucesso"
             
         except Exception as e:
@@ -119,9 +155,10 @@ class CapexManager:
         try:
             if tag not in self.items:
                 return False, "Item não encontrado"
-                
+
+            self.total_investment -= self.items[tag].total_value
             del self.items[tag]
-            self._update_total()
+            self._version += 1
             return True, "Item removido com sucesso"
             
         except Exception as e:
@@ -148,6 +185,19 @@ class CapexManager:
         """
         return list(self.items.values())
 
+    def to_rows(self):
+        """
+        Serialize all items to Excel rows in one batch.
+
+        Uses a shared attrgetter so each row is a single C-level tuple
+        fetch instead of a to_row call with per-attribute dispatch.
+
+        Returns:
+            list: List of (tag, description, quantity, unit_price,
+                  total_value, month) tuples
+        """
+        return [_CAPEX_ROW_FIELDS(item) for item in self.items.values()]
+
     def get_monthly_investment(self, month):
         """
         Get total investment for a specific month.
@@ -158,19 +208,31 @@ class CapexManager:
         Returns:
             float: Total investment for the month
         """
-        return sum(item.total_value for item in self.items.values() if item.month == month)
+        # List comprehension instead of a generator: sum() consumes it
+        # without per-element frame resumption
+        return sum([item.total_value for item in self.items.values() if item.month == month])
 
     def get_monthly_investments(self):
         """
         Get investments for all months.
-        
+
         Returns:
             list: List of 12 values representing monthly investments
         """
-        monthly = [0.0] * 12
-        for item in self.items.values():
-            monthly[item.month - 1] += item.total_value
-        return monthly
+        return self.get_monthly_investment_array().tolist()
+
+    def get_monthly_investment_array(self):
+        """
+        Get investments for all months as a NumPy array.
+
+        Bins the cached SoA columns with np.bincount, so the whole
+        accumulation runs as one C-level pass over contiguous arrays.
+
+        Returns:
+            numpy.ndarray: Array of shape (12,) with monthly investments
+        """
+        months, totals = self._get_soa()
+        return np.bincount(months - 1, weights=totals, minlength=12)
 
     def import_from_excel(self, filepath):
         """
@@ -183,33 +245,40 @@ class CapexManager:
             tuple: (bool, str) - (success, message)
         """
         try:
-            wb = load_workbook(filepath, read_only=True)
-            ws = wb.active
-            
-            # Skip header row
-            rows = list(ws.rows)[1:]
-            
             success_count = 0
             error_count = 0
-            
-            for row in rows:
+            new_items = {}
+            running_total = 0.0
+
+            # Stream plain values past the header row; no Cell objects.
+            # Items are batched and the total applied once at the end, so
+            # the import stays O(N) instead of paying per-row bookkeeping.
+            for row in iter_data_rows(filepath):
                 try:
                     # Assuming Excel structure: TAG, Description, Quantity, Unit Price, Month
-                    tag = row[0].value
-                    description = row[1].value
-                    quantity = float(row[2].value or 0)
-                    unit_price = float(row[3].value or 0)
-                    month = int(row[4].value or 1)
-                    
-                    success, _ = self.add_item(description, quantity, unit_price, month, tag)
-                    if success:
-                        success_count += 1
-                    else:
+                    tag, description, quantity, unit_price, month = row[:5]
+                    # Descriptions repeat across rows; interning collapses
+                    # duplicates to one shared string object
+                    description = sys.intern(str(description or ""))
+                    item = CapExItem(tag, description, float(quantity or 0),
+                                     float(unit_price or 0), int(month or 1))
+
+                    is_valid, _ = item.validate()
+                    if not is_valid or item.tag in self.items or item.tag in new_items:
                         error_count += 1
-                        
+                        continue
+
+                    new_items[item.tag] = item
+                    running_total += item.total_value
+                    success_count += 1
+
                 except Exception:
                     error_count += 1
-                    
+
+            self.items.update(new_items)
+            self.total_investment += running_total
+            self._version += 1
+
             return True, f"Importação concluída. Sucesso: {success_count}, Erros: {error_count}"
             
         except Exception as e:
@@ -218,38 +287,52 @@ class CapexManager:
     def export_to_excel(self, filepath):
         """
         Export CapEx items to an Excel file.
-        
+
+        Uses xlsxwriter in constant-memory mode when available, so each
+        row is flushed straight to disk instead of being held as cell
+        objects. Falls back to openpyxl when xlsxwriter is not installed.
+
         Args:
             filepath (str): Path to save the Excel file
-            
+
         Returns:
             tuple: (bool, str) - (success, message)
         """
+        headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total", "Mês"]
+
         try:
-            from openpyxl import Workbook
-            
-            wb = Workbook()
-            ws = wb.active
-            
-            # Write headers
-            headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total", "Mês"]
-            ws.append(headers)
-            
-            # Write items
-            for item in self.items.values():
-                ws.append(item.to_row())
-            
-            wb.save(filepath)
+            import xlsxwriter
+        except ImportError:
+            try:
+                from openpyxl import Workbook
+
+                wb = Workbook()
+                ws = wb.active
+                ws.append(headers)
+                for row in self.to_rows():
+                    ws.append(row)
+                wb.save(filepath)
+                return True, "Exportação concluída com sucesso"
+
+            except Exception as e:
+                return False, f"Erro ao exportar arquivo: {str(e)}"
+
+        try:
+            wb = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+            ws = wb.add_worksheet()
+
+            ws.write_row(0, 0, headers)
+            for r, row in enumerate(self.to_rows(), 1):
+                ws.write_row(r, 0, row)
+
+            wb.close()
             return True, "Exportação concluída com sucesso"
-            
+
         except Exception as e:
             return False, f"Erro ao exportar arquivo: {str(e)}"
 
-    def _update_total(self):
-        """Update the total investment value."""
-        self.total_investment = sum(item.total_value for item in self.items.values())
-
     def clear(self):
         """Clear all items."""
         self.items.clear()
         self.total_investment = 0.0
+        self._version += 1
@@ -1,8 +1,18 @@
 from datetime import datetime
-from openpyxl import load_workbook
+import operator
+import sys
+import numpy as np
+from ..excel_utils import iter_data_rows
 from .base_item import BaseFinancialItem
 
+# Single C-level attribute fetch per item when serializing rows in bulk
+_OPEX_ROW_FIELDS = operator.attrgetter(
+    'tag', 'description', 'quantity', 'unit_price', 'total_value',
+    'recurrent', 'start_month', 'end_month')
+
 class OpExItem(BaseFinancialItem):
+    __slots__ = ('recurrent', 'start_month', 'end_month', '_monthly_contrib')
+
     def __init__(self, tag=None, description="", quantity=0, unit_price=0.0, recurrent=True, start_month=1, end_month=12):
         """
         Initialize an OpEx item.
@@ -20,6 +30,18 @@ class OpExItem(BaseFinancialItem):
         self.recurrent = recurrent
         self.start_month = max(1, min(12, int(start_month)))
         self.end_month = max(self.start_month, min(12, int(end_month)))
+        self._recompute_contrib()
+
+    def _recompute_contrib(self):
+        """Rebuild the cached 12-element monthly contribution vector."""
+        contrib = np.zeros(12)
+        contrib[self.start_month - 1:self.end_month] = self.total_value
+        self._monthly_contrib = contrib
+
+    def update(self, description=None, quantity=None, unit_price=None):
+        """Extend base update to refresh the monthly contribution vector."""
+        super().update(description, quantity, unit_price)
+        self._recompute_contrib()
 
     def to_dict(self):
         """Extend base to_dict with OpEx specific attributes."""
@@ -43,27 +65,33 @@ class OpExItem(BaseFinancialItem):
         item.recurrent = data.get("recurrent", True)
         item.start_month = data.get("start_month", 1)
         item.end_month = data.get("end_month", 12)
+        item._recompute_contrib()
         return item
 
     def get_monthly_cost(self, month):
         """
         Calculate the cost for a specific month.
-        
+
         Args:
             month (int): Month number (1-12)
-            
+
         Returns:
             float: Cost for the specified month
         """
-        if self.start_month <= month <= self.end_month:
-            return self.total_value
-        return 0.0
+        return float(self._monthly_contrib[month - 1])
 
 class OpexManager:
     def __init__(self):
         """Initialize the OpEx manager."""
         self.items = {}  # Dictionary to store items by TAG
-        self.total_annual_cost = 0.0
+        # Maintained incrementally by the mutators through per-item
+        # contribution deltas, never re-summed from scratch
+        self._monthly_totals = np.zeros(12)
+
+    @property
+    def total_annual_cost(self):
+        """Total annual cost across all items."""
+        return float(self._monthly_totals.sum())
 
     def add_item(self, description, quantity, unit_price, recurrent=True, 
                  start_month=1, end_month=12, tag=None):
@@ -94,7 +122,7 @@ class OpexManager:
                 return False, "TAG já existe"
                 
             self.items[item.tag] = item
-            self._update_total()
+            self._monthly_totals += item._monthly_contrib
             return True, "Item adicionado com sucesso"
             
         except Exception as e:
@@ -122,20 +150,26 @@ class OpexManager:
                 return False, "Item não encontrado"
                 
             item = self.items[tag]
+            old_contrib = item._monthly_contrib
             item.update(description, quantity, unit_price)
-            
+
             if recurrent is not None:
                 item.recurrent = recurrent
             if start_month is not None:
                 item.start_month = max(1, min(12, int(start_month)))
             if end_month is not None:
                 item.end_month = max(item.start_month, min(12, int(end_month)))
-                
+            if start_month is not None or end_month is not None:
+                item._recompute_contrib()
+
+            # _recompute_contrib replaces the vector, so old_contrib
+            # still holds the pre-update values for the delta
+            self._monthly_totals += item._monthly_contrib - old_contrib
+
             is_valid, error_msg = item.validate()
             if not is_valid:
                 return False, error_msg
-                
-            self._update_total()
+
             return True, "Item atualizado com sucesso"
             
         except Exception as e:
@@ -155,8 +189,8 @@ class OpexManager:
             if tag not in self.items:
                 return False, "Item não encontrado"
                 
+            self._monthly_totals -= self.items[tag]._monthly_contrib
             del self.items[tag]
-            self._update_total()
             return True, "Item removido com sucesso"
             
         except Exception as e:
@@ -183,6 +217,19 @@ class OpexManager:
         """
         return list(self.items.values())
 
+    def to_rows(self):
+        """
+        Serialize all items to Excel rows in one batch.
+
+        Uses a shared attrgetter so each row is a single C-level tuple
+        fetch instead of a to_row call with per-attribute dispatch.
+
+        Returns:
+            list: List of (tag, description, quantity, unit_price,
+                  total_value, recurrent, start_month, end_month) tuples
+        """
+        return [_OPEX_ROW_FIELDS(item) for item in self.items.values()]
+
     def get_monthly_cost(self, month):
         """
         Get total cost for a specific month.
@@ -193,16 +240,30 @@ class OpexManager:
         Returns:
             float: Total cost for the month
         """
-        return sum(item.get_monthly_cost(month) for item in self.items.values())
+        # Index into the vectorized monthly vector instead of summing a
+        # generator over every item
+        return float(self.get_monthly_cost_array()[month - 1])
 
     def get_monthly_costs(self):
         """
         Get costs for all months.
-        
+
         Returns:
             list: List of 12 values representing monthly costs
         """
-        return [self.get_monthly_cost(month) for month in range(1, 13)]
+        return self.get_monthly_cost_array().tolist()
+
+    def get_monthly_cost_array(self):
+        """
+        Get costs for all months as a NumPy array.
+
+        The vector is maintained incrementally by the mutators, so this
+        is a copy of the running totals rather than a recomputation.
+
+        Returns:
+            numpy.ndarray: Array of shape (12,) with monthly costs
+        """
+        return self._monthly_totals.copy()
 
     def import_from_excel(self, filepath):
         """
@@ -215,38 +276,41 @@ class OpexManager:
             tuple: (bool, str) - (success, message)
         """
         try:
-            wb = load_workbook(filepath, read_only=True)
-            ws = wb.active
-            
-            # Skip header row
-            rows = list(ws.rows)[1:]
-            
             success_count = 0
             error_count = 0
-            
-            for row in rows:
+            new_items = {}
+            running_contrib = np.zeros(12)
+
+            # Stream plain values past the header row; no Cell objects.
+            # Items are batched and the running totals applied once at
+            # the end, so the import stays O(N) with no per-row
+            # bookkeeping.
+            for row in iter_data_rows(filepath):
                 try:
                     # Assuming Excel structure: TAG, Description, Quantity, Unit Price, Recurrent, Start Month, End Month
-                    tag = row[0].value
-                    description = row[1].value
-                    quantity = float(row[2].value or 0)
-                    unit_price = float(row[3].value or 0)
-                    recurrent = bool(row[4].value)
-                    start_month = int(row[5].value or 1)
-                    end_month = int(row[6].value or 12)
-                    
-                    success, _ = self.add_item(
-                        description, quantity, unit_price, recurrent,
-                        start_month, end_month, tag
-                    )
-                    if success:
-                        success_count += 1
-                    else:
+                    tag, description, quantity, unit_price, recurrent, start_month, end_month = row[:7]
+                    # Descriptions repeat across rows; interning collapses
+                    # duplicates to one shared string object
+                    description = sys.intern(str(description or ""))
+                    item = OpExItem(tag, description, float(quantity or 0),
+                                    float(unit_price or 0), bool(recurrent),
+                                    int(start_month or 1), int(end_month or 12))
+
+                    is_valid, _ = item.validate()
+                    if not is_valid or item.tag in self.items or item.tag in new_items:
                         error_count += 1
-                        
+                        continue
+
+                    new_items[item.tag] = item
+                    running_contrib += item._monthly_contrib
+                    success_count += 1
+
                 except Exception:
                     error_count += 1
-                    
+
+            self.items.update(new_items)
+            self._monthly_totals += running_contrib
+
             return True, f"Importação concluída. Sucesso: {success_count}, Erros: {error_count}"
             
         except Exception as e:
@@ -255,40 +319,52 @@ class OpexManager:
     def export_to_excel(self, filepath):
         """
         Export OpEx items to an Excel file.
-        
+
+        Uses xlsxwriter in constant-memory mode when available, so each
+        row is flushed straight to disk instead of being held as cell
+        objects. Falls back to openpyxl when xlsxwriter is not installed.
+
         Args:
             filepath (str): Path to save the Excel file
-            
+
         Returns:
             tuple: (bool, str) - (success, message)
         """
+        headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total",
+                   "Recorrente", "Mês Inicial", "Mês Final"]
+
         try:
-            from openpyxl import Workbook
-            
-            wb = Workbook()
-            ws = wb.active
-            
-            # Write headers
-            headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total",
-                      "Recorrente", "Mês Inicial", "Mês Final"]
-            ws.append(headers)
-            
-            # Write items
-            for item in self.items.values():
-                ws.append(item.to_row())
-            
-            wb.save(filepath)
+            import xlsxwriter
+        except ImportError:
+            try:
+                from openpyxl import Workbook
+
+                wb = Workbook()
+                ws = wb.active
+                ws.append(headers)
+                for row in self.to_rows():
+                    ws.append(row)
+                wb.save(filepath)
+                return True, "Exportação concluída com sucesso"
+
+            except Exception as e:
+                return False, f"Erro ao exportar arquivo: {str(e)}"
+
+        try:
+            wb = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+            ws = wb.add_worksheet()
+
+            ws.write_row(0, 0, headers)
+            for r, row in enumerate(self.to_rows(), 1):
+                ws.write_row(r, 0, row)
+
+            wb.close()
             return True, "Exportação concluída com sucesso"
-            
+
         except Exception as e:
             return False, f"Erro ao exportar arquivo: {str(e)}"
 
-    def _update_total(self):
-        """Update the total annual cost."""
-        monthly_costs = self.get_monthly_costs()
-        self.total_annual_cost = sum(monthly_costs)
-
     def clear(self):
         """Clear all items."""
         self.items.clear()
-        self.total_annual_cost = 0.0
+        self._monthly_totals = np.zeros(12)
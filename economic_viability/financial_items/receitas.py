@@ -1,9 +1,57 @@
 from datetime import datetime
-from openpyxl import load_workbook
+import operator
+import numpy as np
+from ..excel_utils import iter_data_rows
 from .base_item import BaseFinancialItem
+from ..jit import njit, HAVE_NUMBA
+
+# Shared mutation messages, built once instead of per call
+_MSG_TAG_EXISTS = "TAG já existe"
+_MSG_NOT_FOUND = "Item não encontrado"
+_MSG_ADDED = "Item adicionado com sucesso"
+_MSG_UPDATED = "Item atualizado com sucesso"
+_MSG_DELETED = "Item removido com sucesso"
+
+# Single C-level attribute fetch per item when serializing rows in bulk
+_RECEITA_ROW_FIELDS = operator.attrgetter(
+    'tag', 'description', 'quantity', 'unit_price', 'total_value',
+    'recurrent', 'start_month', 'end_month', 'growth_rate')
+
+@njit(cache=True, fastmath=True)
+def _revenues_kernel(totals, starts, ends, growths):
+    """
+    Accumulate per-item compounded revenues into a 12-month vector.
+
+    Compiled by numba into a single fused loop with no temporary
+    arrays; the manager only dispatches here when numba is installed,
+    since the plain-Python fallback would be slower than broadcasting.
+
+    Args:
+        totals (numpy.ndarray): Total value per item
+        starts (numpy.ndarray): Start month per item (1-12)
+        ends (numpy.ndarray): End month per item (1-12)
+        growths (numpy.ndarray): Monthly growth rate per item (percent)
+
+    Returns:
+        numpy.ndarray: Array of shape (12,) with monthly revenues
+    """
+    out = np.zeros(12)
+    for i in range(totals.shape[0]):
+        base = 1.0 + growths[i] * 0.01
+        for m in range(12):
+            month = m + 1
+            # Branchless gate: the comparisons compile to a conditional
+            # move instead of a data-dependent branch, keeping the inner
+            # loop vectorizable
+            active = (starts[i] <= month) & (month <= ends[i])
+            out[m] += totals[i] * base ** (month - starts[i]) * active
+    return out
 
 class ReceitaItem(BaseFinancialItem):
-    def __init__(self, tag=None, description="", quantity=0, unit_price=0.0, 
+    __slots__ = ('recurrent', 'start_month', 'end_month', 'growth_rate',
+                 '_monthly_cache', '_growth_powers')
+
+    def __init__(self, tag=None, description="", quantity=0, unit_price=0.0,
                  recurrent=True, start_month=1, end_month=12, growth_rate=0.0):
         """
         Initialize a Receita (Revenue) item.
@@ -23,6 +71,48 @@ class ReceitaItem(BaseFinancialItem):
         self.start_month = max(1, min(12, int(start_month)))
         self.end_month = max(self.start_month, min(12, int(end_month)))
         self.growth_rate = max(0.0, min(100.0, float(growth_rate)))
+        self._monthly_cache = None
+        self._growth_powers = None
+
+    def update(self, description=None, quantity=None, unit_price=None):
+        """Extend base update to drop the cached monthly vector."""
+        super().update(description, quantity, unit_price)
+        self._monthly_cache = None
+
+    @property
+    def annual_value(self):
+        """Total revenue this item generates across the 12 months."""
+        return sum(self.monthly_vector())
+
+    def monthly_vector(self):
+        """
+        Get the 12-month revenue vector for this item.
+
+        The vector is a pure function of total_value, the month range
+        and growth_rate, so it is computed once and reused until a
+        mutation drops the cache.
+
+        Returns:
+            tuple: 12 revenue values, one per month
+        """
+        if self._monthly_cache is None:
+            self._monthly_cache = tuple(self.get_monthly_revenue(m) for m in range(1, 13))
+        return self._monthly_cache
+
+    def _get_growth_powers(self):
+        """
+        Get the cumulative growth factors [1, g, g², ...] for 12 months.
+
+        Built once per growth rate as a cumulative product, so revenue
+        lookups index into the vector instead of calling pow().
+
+        Returns:
+            numpy.ndarray: Array of shape (12,) with compounding factors
+        """
+        if self._growth_powers is None:
+            base = 1.0 + self.growth_rate / 100.0
+            self._growth_powers = np.cumprod(np.full(12, base)) / base
+        return self._growth_powers
 
     def to_dict(self):
         """Extend base to_dict with Receita specific attributes."""
@@ -61,9 +151,7 @@ class ReceitaItem(BaseFinancialItem):
             float: Revenue for the specified month
         """
         if self.start_month <= month <= self.end_month:
-            months_passed = month - self.start_month
-            growth_factor = (1 + self.growth_rate/100) ** months_passed
-            return self.total_value * growth_factor
+            return float(self.total_value * self._get_growth_powers()[month - self.start_month])
         return 0.0
 
 class ReceitasManager:
@@ -71,12 +159,43 @@ class ReceitasManager:
         """Initialize the Receitas manager."""
         self.items = {}  # Dictionary to store items by TAG
         self.total_annual_revenue = 0.0
+        self._version = 0
+        self._soa_cache = None
+        self._soa_cache_version = -1
+        self._monthly_vec = None
+        self._monthly_vec_version = -1
+
+    def _get_soa(self):
+        """
+        Get (totals, starts, ends, growths) arrays over all items.
+
+        Rebuilt only when the item set has changed since the last
+        access, tracked by a version counter bumped by every mutation.
+
+        Returns:
+            tuple: (totals, starts, ends, growths) numpy arrays, one
+                   entry per item
+        """
+        if self._soa_cache_version != self._version:
+            items = list(self.items.values())
+            count = len(items)
+            # Months fit in one byte; the compact dtype keeps the whole
+            # column set cache-resident for large portfolios
+            self._soa_cache = (
+                np.fromiter((item.total_value for item in items), dtype=np.float64, count=count),
+                np.fromiter((item.start_month for item in items), dtype=np.int8, count=count),
+                np.fromiter((item.end_month for item in items), dtype=np.int8, count=count),
+                np.fromiter((item.growth_rate for item in items), dtype=np.float64, count=count)
+            )
+            self._soa_cache_version = self._version
+        return self._soa_cache
 
     def add_item(self, description, quantity, unit_price, recurrent=True,
-                 start_month=1, end_month=12, growth_rate=0.0, tag=None):
+                 start_month=1, end_month=12, growth_rate=0.0, tag=None,
+                 validate=True):
         """
         Add a new Receita item.
-        
+
         Args:
             description (str): Description of the item
             quantity (float): Quantity of the item
@@ -86,27 +205,33 @@ class ReceitasManager:
             end_month (int): Month when the revenue ends
             growth_rate (float): Monthly growth rate in percentage
             tag (str, optional): Unique identifier for the item
-            
+            validate (bool): Skip the field checks when False, for data
+                that was already validated (e.g. an export round-trip)
+
         Returns:
             tuple: (bool, str) - (success, message)
         """
+        # Only the construction can realistically fail (bad numeric
+        # input); the staging below is guarded by explicit checks
         try:
             item = ReceitaItem(tag, description, quantity, unit_price,
                              recurrent, start_month, end_month, growth_rate)
+        except (TypeError, ValueError, AttributeError) as e:
+            return False, f"Erro ao adicionar item: {str(e)}"
+
+        if validate:
             is_valid, error_msg = item.validate()
-            
+
             if not is_valid:
                 return False, error_msg
-                
-            if item.tag in self.items:
-                return False, "TAG já existe"
-                
-            self.items[item.tag] = item
-            self._update_total()
-            return True, "Item adicionado com sucesso"
-            
-        except Exception as e:
-            return False, f"Erro ao adicionar item: {str(e)}"
+
+        if item.tag in self.items:
+            return False, _MSG_TAG_EXISTS
+
+        self.items[item.tag] = item
+        self._version += 1
+        self.total_annual_revenue += item.annual_value
+        return True, _MSG_ADDED
 
     def update_item(self, tag, description=None, quantity=None, unit_price=None,
                    recurrent=None, start_month=None, end_month=None, growth_rate=None):
@@ -126,13 +251,17 @@ class ReceitasManager:
         Returns:
             tuple: (bool, str) - (success, message)
         """
+        item = self.items.get(tag)
+        if item is None:
+            return False, _MSG_NOT_FOUND
+
+        old_annual = item.annual_value
+
+        # Only the field coercions can realistically fail (bad numeric
+        # input); the bookkeeping below is plain arithmetic
         try:
-            if tag not in self.items:
-                return False, "Item não encontrado"
-                
-            item = self.items[tag]
             item.update(description, quantity, unit_price)
-            
+
             if recurrent is not None:
                 item.recurrent = recurrent
             if start_month is not None:
@@ -141,17 +270,22 @@ class ReceitasManager:
                 item.end_month = max(item.start_month, min(12, int(end_month)))
             if growth_rate is not None:
                 item.growth_rate = max(0.0, min(100.0, float(growth_rate)))
-                
-            is_valid, error_msg = item.validate()
-            if not is_valid:
-                return False, error_msg
-                
-            self._update_total()
-            return True, "Item atualizado com sucesso"
-            
-        except Exception as e:
+                item._growth_powers = None
+        except (TypeError, ValueError, AttributeError) as e:
             return False, f"Erro ao atualizar item: {str(e)}"
 
+        if start_month is not None or end_month is not None or growth_rate is not None:
+            item._monthly_cache = None
+
+        self._version += 1
+        self.total_annual_revenue += item.annual_value - old_annual
+
+        is_valid, error_msg = item.validate()
+        if not is_valid:
+            return False, error_msg
+
+        return True, _MSG_UPDATED
+
     def delete_item(self, tag):
         """
         Delete a Receita item.
@@ -162,16 +296,13 @@ class ReceitasManager:
         Returns:
             tuple: (bool, str) - (success, message)
         """
-        try:
-            if tag not in self.items:
-                return False, "Item não encontrado"
-                
-            del self.items[tag]
-            self._update_total()
-            return True, "Item removido com sucesso"
-            
-        except Exception as e:
-            return False, f"Erro ao remover item: {str(e)}"
+        if tag not in self.items:
+            return False, _MSG_NOT_FOUND
+
+        self._version += 1
+        self.total_annual_revenue -= self.items[tag].annual_value
+        del self.items[tag]
+        return True, _MSG_DELETED
 
     def get_item(self, tag):
         """
@@ -194,73 +325,205 @@ class ReceitasManager:
         """
         return list(self.items.values())
 
+    def _get_monthly_vector(self):
+        """
+        Get the aggregated 12-month revenue vector.
+
+        Recomputed only when the item set has changed since the last
+        access, so repeated month queries between mutations (UI redraws,
+        plotting) reuse one array.
+
+        Returns:
+            numpy.ndarray: Array of shape (12,) with monthly revenues
+        """
+        if self._monthly_vec_version != self._version:
+            totals, starts, ends, growths = self._get_soa()
+
+            if HAVE_NUMBA:
+                self._monthly_vec = _revenues_kernel(totals, starts, ends, growths)
+            else:
+                # Broadcast the SoA columns against the month axis so
+                # the growth compounding and start/end gating for every
+                # (item, month) pair run as one C-level expression
+                months = np.arange(1, 13)
+                months_passed = np.clip(months[None, :] - starts[:, None], 0, None)
+                active = (months[None, :] >= starts[:, None]) & (months[None, :] <= ends[:, None])
+                factors = (1.0 + growths[:, None] / 100.0) ** months_passed
+                self._monthly_vec = (totals[:, None] * factors * active).sum(axis=0)
+
+            self._monthly_vec_version = self._version
+        return self._monthly_vec
+
+    def to_rows(self):
+        """
+        Serialize all items to Excel rows in one batch.
+
+        Uses a shared attrgetter so each row is a single C-level tuple
+        fetch instead of a to_row call with per-attribute dispatch.
+
+        Returns:
+            list: List of (tag, description, quantity, unit_price,
+                  total_value, recurrent, start_month, end_month,
+                  growth_rate) tuples
+        """
+        return [_RECEITA_ROW_FIELDS(item) for item in self.items.values()]
+
     def get_monthly_revenue(self, month):
         """
         Get total revenue for a specific month.
-        
+
         Args:
             month (int): Month number (1-12)
-            
+
         Returns:
             float: Total revenue for the month
         """
-        return sum(item.get_monthly_revenue(month) for item in self.items.values())
+        # Index into the cached aggregate instead of summing a generator
+        # over every item
+        return float(self._get_monthly_vector()[month - 1])
 
     def get_monthly_revenues(self):
         """
         Get revenues for all months.
-        
+
         Returns:
             list: List of 12 values representing monthly revenues
         """
-        return [self.get_monthly_revenue(month) for month in range(1, 13)]
+        return self._get_monthly_vector().tolist()
+
+    def get_monthly_revenue_array(self):
+        """
+        Get revenues for all months as a NumPy array.
+
+        Returns:
+            numpy.ndarray: Array of shape (12,) with monthly revenues
+        """
+        return self._get_monthly_vector().copy()
+
+    def bulk_add(self, rows_iter, validate=True):
+        """
+        Add many Receita items in one batch.
+
+        Items are constructed and staged without touching the running
+        totals; the annual revenue is recomputed exactly once at the
+        end, keeping N-row loads O(N) instead of O(N²).
+
+        Args:
+            rows_iter: Iterable of (tag, description, quantity,
+                       unit_price, recurrent, start_month, end_month,
+                       growth_rate) tuples
+            validate (bool): Skip the per-item field checks when False.
+                Reserved for trusted internal callers whose rows are
+                known valid; anything fed from user-supplied files must
+                keep validation on
+
+        Returns:
+            tuple: (int, int) - (success_count, error_count)
+        """
+        success_count = 0
+        error_count = 0
+        new_items = {}
+
+        for row in rows_iter:
+            try:
+                tag, description, quantity, unit_price, recurrent, start_month, end_month, growth_rate = row
+                item = ReceitaItem(tag, description, float(quantity or 0),
+                                   float(unit_price or 0), bool(recurrent),
+                                   int(start_month or 1), int(end_month or 12),
+                                   float(growth_rate or 0))
+
+                if validate and not item.validate()[0]:
+                    error_count += 1
+                    continue
+                if item.tag in self.items or item.tag in new_items:
+                    error_count += 1
+                    continue
+
+                new_items[item.tag] = item
+                success_count += 1
+
+            except Exception:
+                error_count += 1
+
+        self.items.update(new_items)
+        self._update_total()
+
+        return success_count, error_count
+
+    def bulk_add_arrays(self, tags, descriptions, quantities, unit_prices,
+                        recurrents, starts, ends, growths):
+        """
+        Add many Receita items from parallel columns.
+
+        The numeric columns are cast to their target dtypes in one
+        vectorized pass instead of a float()/int() call per cell, and
+        the annual total is recomputed once at the end.
+
+        Args:
+            tags: Sequence of item tags
+            descriptions: Sequence of item descriptions
+            quantities: Sequence of quantities
+            unit_prices: Sequence of unit prices
+            recurrents: Sequence of recurrent flags
+            starts: Sequence of start months (1-12)
+            ends: Sequence of end months (1-12)
+            growths: Sequence of monthly growth rates (percent)
+
+        Returns:
+            tuple: (int, int) - (success_count, error_count)
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        unit_prices = np.asarray(unit_prices, dtype=np.float64)
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        growths = np.asarray(growths, dtype=np.float64)
+
+        success_count = 0
+        error_count = 0
+        new_items = {}
+
+        for i, tag in enumerate(tags):
+            try:
+                item = ReceitaItem(tag, descriptions[i], quantities[i],
+                                   unit_prices[i], bool(recurrents[i]),
+                                   starts[i], ends[i], growths[i])
+
+                if item.tag in self.items or item.tag in new_items:
+                    error_count += 1
+                    continue
+
+                new_items[item.tag] = item
+                success_count += 1
+
+            except Exception:
+                error_count += 1
+
+        self.items.update(new_items)
+        self._update_total()
+
+        return success_count, error_count
 
     def import_from_excel(self, filepath):
         """
         Import Receita items from an Excel file.
-        
+
         Args:
             filepath (str): Path to the Excel file
-            
+
         Returns:
             tuple: (bool, str) - (success, message)
         """
         try:
-            wb = load_workbook(filepath, read_only=True)
-            ws = wb.active
-            
-            # Skip header row
-            rows = list(ws.rows)[1:]
-            
-            success_count = 0
-            error_count = 0
-            
-            for row in rows:
-                try:
-                    # Assuming Excel structure: TAG, Description, Quantity, Unit Price, Recurrent, Start Month, End Month, Growth Rate
-                    tag = row[0].value
-                    description = row[1].value
-                    quantity = float(row[2].value or 0)
-                    unit_price = float(row[3].value or 0)
-                    recurrent = bool(row[4].value)
-                    start_month = int(row[5].value or 1)
-                    end_month = int(row[6].value or 12)
-                    growth_rate = float(row[7].value or 0)
-                    
-                    success, _ = self.add_item(
-                        description, quantity, unit_price, recurrent,
-                        start_month, end_month, growth_rate, tag
-                    )
-                    if success:
-                        success_count += 1
-                    else:
-                        error_count += 1
-                        
-                except Exception:
-                    error_count += 1
-                    
+            # Stream plain values past the header row; no Cell objects.
+            # bulk_add defers the total recompute to the end of the
+            # batch. The file comes from the user's open dialog, so the
+            # per-item field checks stay on; they read the validity
+            # already computed by the constructor, costing nothing extra.
+            rows = (row[:8] for row in iter_data_rows(filepath))
+            success_count, error_count = self.bulk_add(rows)
+
             return True, f"Importação concluída. Sucesso: {success_count}, Erros: {error_count}"
-            
+
         except Exception as e:
             return False, f"Erro ao importar arquivo: {str(e)}"
 
@@ -276,19 +539,22 @@ class ReceitasManager:
         """
         try:
             from openpyxl import Workbook
-            
-            wb = Workbook()
-            ws = wb.active
-            
+
+            # Write-only mode streams each appended row out instead of
+            # holding the whole sheet as Cell objects
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+
             # Write headers
             headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total",
                       "Recorrente", "Mês Inicial", "Mês Final", "Taxa de Crescimento (%)"]
             ws.append(headers)
-            
-            # Write items
-            for item in self.items.values():
-                ws.append(item.to_row())
-            
+
+            # Write items as batched tuples, skipping per-item to_row
+            # list allocation
+            for row in self.to_rows():
+                ws.append(row)
+
             wb.save(filepath)
             return True, "Exportação concluída com sucesso"
             
@@ -296,11 +562,17 @@ class ReceitasManager:
             return False, f"Erro ao exportar arquivo: {str(e)}"
 
     def _update_total(self):
-        """Update the total annual revenue."""
-        monthly_revenues = self.get_monthly_revenues()
-        self.total_annual_revenue = sum(monthly_revenues)
+        """
+        Recompute the total annual revenue from scratch.
+
+        The mutators keep the total current with per-item deltas; this
+        full recompute is only needed after batch loads.
+        """
+        self._version += 1
+        self.total_annual_revenue = float(self.get_monthly_revenue_array().sum())
 
     def clear(self):
         """Clear all items."""
         self.items.clear()
+        self._version += 1
         self.total_annual_revenue = 0.0
@@ -0,0 +1,24 @@
+"""Optional numba acceleration for numeric kernels.
+
+Importing njit from here yields the real decorator when numba is
+installed and a transparent no-op otherwise, so kernels run either as
+compiled LLVM loops or as plain numpy code.
+"""
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    # Plain range keeps prange-using kernels valid Python; callers
+    # dispatch on HAVE_NUMBA when a vectorized fallback is faster
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
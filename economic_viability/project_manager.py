@@ -1,7 +1,126 @@
+import io
 import os
 import json
 from datetime import datetime
 from openpyxl import Workbook, load_workbook
+from .excel_utils import reset_sheet
+
+# All project data lives in one workbook: the zip container parts
+# (styles, theme, rels) are shared by the four sheets instead of being
+# duplicated across four files
+PROJECT_FILENAME = "project.xlsx"
+
+_SHEET_NAMES = {
+    "capex": "CapEx",
+    "opex": "OpEx",
+    "receitas": "Receitas",
+    "config": "Configuração"
+}
+
+# orjson serializes straight to bytes in C and is several times faster
+# than the stdlib encoder; fall back transparently when not installed
+try:
+    import orjson
+
+    _JSON_WRITE_MODE = "wb"
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    _JSON_WRITE_MODE = "w"
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=4)
+
+    _json_loads = json.loads
+
+# Serialized bytes of the empty project workbook, built once on first
+# use: every new project starts identical, so one serialization serves all
+_project_template_bytes = None
+
+def _get_project_template_bytes():
+    """Get the serialized empty project workbook, building it on first call."""
+    global _project_template_bytes
+    if _project_template_bytes is None:
+        wb = Workbook()
+        wb.remove(wb.active)
+
+        headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total"]
+        for kind in ("capex", "opex", "receitas"):
+            wb.create_sheet(_SHEET_NAMES[kind]).append(headers)
+
+        ws = wb.create_sheet(_SHEET_NAMES["config"])
+        ws.append(["Parâmetro", "Valor"])
+        ws.append(["TMA", "0.0"])
+        ws.append(["IR", "0.0"])
+        ws.append(["CSLL", "0.0"])
+
+        buf = io.BytesIO()
+        wb.save(buf)
+        _project_template_bytes = buf.getvalue()
+    return _project_template_bytes
+
+class ProjectFiles:
+    """
+    Lazy accessor for a project's Excel workbooks.
+
+    Indexing by kind ("capex", "opex", "receitas", "config") opens the
+    workbook read-only on first access and caches the handle, so a flow
+    that only touches one sheet never parses the other three files.
+    """
+
+    def __init__(self, paths):
+        """
+        Initialize the accessor.
+
+        Args:
+            paths (dict): Mapping of kind to workbook file path
+        """
+        self.paths = paths
+        self._workbooks = {}
+
+    def __getitem__(self, kind):
+        """
+        Get the workbook for a kind, opening it on first access.
+
+        The cache is keyed by path, so kinds that live in the same
+        consolidated workbook share one handle.
+
+        Args:
+            kind (str): One of the keys in paths
+
+        Returns:
+            Workbook: openpyxl workbook opened read-only
+        """
+        path = self.paths[kind]
+        wb = self._workbooks.get(path)
+        if wb is None:
+            wb = load_workbook(path, read_only=True, data_only=True)
+            self._workbooks[path] = wb
+        return wb
+
+    def __contains__(self, kind):
+        return kind in self.paths
+
+    def path(self, kind):
+        """
+        Get the file path for a kind without opening the workbook.
+
+        Args:
+            kind (str): One of the keys in paths
+
+        Returns:
+            str: Path to the workbook file
+        """
+        return self.paths[kind]
+
+    def close_all(self):
+        """Close every workbook opened so far and drop the handles."""
+        for wb in self._workbooks.values():
+            wb.close()
+        self._workbooks.clear()
 
 class ProjectManager:
     def __init__(self):
@@ -9,6 +128,75 @@ class ProjectManager:
         self.projects_dir = "projects"
         self.ensure_directory_exists()
         self.current_project = None
+        self._index_path = os.path.join(self.projects_dir, "index.json")
+
+    def _load_index(self):
+        """
+        Load the cached project index, rebuilding it when missing.
+
+        Returns:
+            dict: Mapping of project name to its metadata summary
+        """
+        try:
+            with open(self._index_path, "rb") as f:
+                return _json_loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return self.rebuild_index()
+
+    def _upsert_index(self, name, metadata):
+        """
+        Insert or refresh one project's entry in the index file.
+
+        The updated index is written to a temporary file and moved into
+        place with os.replace so readers never see a partial write.
+
+        Args:
+            name (str): Project name
+            metadata (dict): Project metadata to summarize
+        """
+        index = self._load_index()
+        index[name] = {
+            "name": metadata["name"],
+            "last_modified": metadata["last_modified"]
+        }
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, _JSON_WRITE_MODE) as f:
+            f.write(_json_dumps(index))
+        os.replace(tmp_path, self._index_path)
+
+    def rebuild_index(self):
+        """
+        Rebuild the project index by scanning the projects directory.
+
+        Fallback for a missing or corrupt index file; the result is
+        written back so later listings are a single file read.
+
+        Returns:
+            dict: Mapping of project name to its metadata summary
+        """
+        index = {}
+        # scandir carries type info from the readdir call, so skipping
+        # non-directories needs no extra stat per entry
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                metadata_path = os.path.join(entry.path, "metadata.json")
+                try:
+                    with open(metadata_path, "rb") as f:
+                        metadata = _json_loads(f.read())
+                except (FileNotFoundError, ValueError):
+                    continue
+                index[metadata["name"]] = {
+                    "name": metadata["name"],
+                    "last_modified": metadata.get("last_modified", "")
+                }
+
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, _JSON_WRITE_MODE) as f:
+            f.write(_json_dumps(index))
+        os.replace(tmp_path, self._index_path)
+        return index
 
     def ensure_directory_exists(self):
         """Ensure the projects directory exists."""
@@ -47,12 +235,14 @@ class ProjectManager:
             }
 
             # Save metadata
-            with open(os.path.join(project_dir, "metadata.json"), "w") as f:
-                json.dump(metadata, f, indent=4)
+            with open(os.path.join(project_dir, "metadata.json"), _JSON_WRITE_MODE) as f:
+                f.write(_json_dumps(metadata))
 
             # Create initial Excel files
             self._create_initial_files(project_dir)
 
+            self._upsert_index(name, metadata)
+
             return True
 
         except Exception as e:
@@ -66,37 +256,10 @@ class ProjectManager:
         Args:
             project_dir (str): Path to the project directory
         """
-        # Create CapEx file
-        wb_capex = Workbook()
-        ws = wb_capex.active
-        ws.title = "CapEx"
-        headers = ["TAG", "Descrição", "Quantidade", "Valor Unitário", "Valor Total"]
-        ws.append(headers)
-        wb_capex.save(os.path.join(project_dir, "capex.xlsx"))
-
-        # Create OpEx file
-        wb_opex = Workbook()
-        ws = wb_opex.active
-        ws.title = "OpEx"
-        ws.append(headers)
-        wb_opex.save(os.path.join(project_dir, "opex.xlsx"))
-
-        # Create Receitas file
-        wb_receitas = Workbook()
-        ws = wb_receitas.active
-        ws.title = "Receitas"
-        ws.append(headers)
-        wb_receitas.save(os.path.join(project_dir, "receitas.xlsx"))
-
-        # Create Config file
-        wb_config = Workbook()
-        ws = wb_config.active
-        ws.title = "Configuração"
-        ws.append(["Parâmetro", "Valor"])
-        ws.append(["TMA", "0.0"])
-        ws.append(["IR", "0.0"])
-        ws.append(["CSLL", "0.0"])
-        wb_config.save(os.path.join(project_dir, "config.xlsx"))
+        # One workbook with the four sheets: a single template byte
+        # write instead of four separate openpyxl saves
+        with open(os.path.join(project_dir, PROJECT_FILENAME), "wb") as f:
+            f.write(_get_project_template_bytes())
 
     def list_projects(self):
         """
@@ -106,15 +269,9 @@ class ProjectManager:
             list: List of project names
         """
         try:
-            projects = []
-            for item in os.listdir(self.projects_dir):
-                if os.path.isdir(os.path.join(self.projects_dir, item)):
-                    metadata_path = os.path.join(self.projects_dir, item, "metadata.json")
-                    if os.path.exists(metadata_path):
-                        with open(metadata_path, "r") as f:
-                            metadata = json.load(f)
-                            projects.append(metadata["name"])
-            return projects
+            # One read of the cached index instead of a stat plus JSON
+            # parse per project directory
+            return list(self._load_index().keys())
         except Exception as e:
             print(f"Erro ao listar projetos: {str(e)}")
             return []
@@ -135,18 +292,23 @@ class ProjectManager:
                 raise ValueError("Projeto não encontrado")
 
             # Load metadata
-            with open(os.path.join(project_dir, "metadata.json"), "r") as f:
-                metadata = json.load(f)
+            with open(os.path.join(project_dir, "metadata.json"), "rb") as f:
+                metadata = _json_loads(f.read())
+
+            # Create project data structure; workbooks open lazily on
+            # first access instead of being parsed up front. New
+            # projects keep everything in one workbook; projects from
+            # before the consolidation still have one file per kind.
+            project_file = os.path.join(project_dir, PROJECT_FILENAME)
+            if os.path.exists(project_file):
+                paths = {kind: project_file for kind in _SHEET_NAMES}
+            else:
+                paths = {kind: os.path.join(project_dir, f"{kind}.xlsx")
+                         for kind in _SHEET_NAMES}
 
-            # Create project data structure
             project_data = {
                 "metadata": metadata,
-                "files": {
-                    "capex": os.path.join(project_dir, "capex.xlsx"),
-                    "opex": os.path.join(project_dir, "opex.xlsx"),
-                    "receitas": os.path.join(project_dir, "receitas.xlsx"),
-                    "config": os.path.join(project_dir, "config.xlsx")
-                }
+                "files": ProjectFiles(paths)
             }
 
             self.current_project = project_data
@@ -174,23 +336,25 @@ class ProjectManager:
 
             # Update metadata
             metadata_path = os.path.join(project_dir, "metadata.json")
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
-            
+            with open(metadata_path, "rb") as f:
+                metadata = _json_loads(f.read())
+
             metadata["last_modified"] = datetime.now().isoformat()
-            
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=4)
-
-            # Save data to respective Excel files
-            if "capex" in data:
-                self._save_excel_data(os.path.join(project_dir, "capex.xlsx"), data["capex"])
-            if "opex" in data:
-                self._save_excel_data(os.path.join(project_dir, "opex.xlsx"), data["opex"])
-            if "receitas" in data:
-                self._save_excel_data(os.path.join(project_dir, "receitas.xlsx"), data["receitas"])
-            if "config" in data:
-                self._save_excel_data(os.path.join(project_dir, "config.xlsx"), data["config"])
+
+            with open(metadata_path, _JSON_WRITE_MODE) as f:
+                f.write(_json_dumps(metadata))
+
+            self._upsert_index(project_name, metadata)
+
+            # Save data into the consolidated workbook, or fall back to
+            # the per-kind files of pre-consolidation projects
+            project_file = os.path.join(project_dir, PROJECT_FILENAME)
+            if os.path.exists(project_file):
+                self._save_consolidated(project_file, data)
+            else:
+                for kind in _SHEET_NAMES:
+                    if kind in data:
+                        self._save_excel_data(os.path.join(project_dir, f"{kind}.xlsx"), data[kind])
 
             return True
 
@@ -198,6 +362,26 @@ class ProjectManager:
             print(f"Erro ao salvar projeto: {str(e)}")
             return False
 
+    def _save_consolidated(self, file_path, data):
+        """
+        Save data into the project workbook, one sheet per kind.
+
+        The workbook is loaded and saved once regardless of how many
+        kinds are being written; each affected sheet is reset in place.
+
+        Args:
+            file_path (str): Path to the project workbook
+            data (dict): Mapping of kind to list of rows
+        """
+        wb = load_workbook(file_path)
+        for kind, sheet_name in _SHEET_NAMES.items():
+            if kind not in data:
+                continue
+            ws = reset_sheet(wb, sheet_name)
+            for row in data[kind]:
+                ws.append(row)
+        wb.save(file_path)
+
     def _save_excel_data(self, file_path, data):
         """
         Save data to an Excel file.
@@ -206,8 +390,10 @@ class ProjectManager:
             file_path (str): Path to the Excel file
             data (list): Data to save
         """
-        wb = Workbook()
-        ws = wb.active
+        # Write-only mode streams each appended row out instead of
+        # holding the whole sheet as Cell objects
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
         for row in data:
             ws.append(row)
         wb.save(file_path)
@@ -1,250 +1,759 @@
+import sqlite3
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog
 
+import numpy as np
+
+# main.py runs this module as a script, the test suite imports it as part
+# of the package; support both import styles
+try:
+    from .config import Config
+    from .financial_calculations import FinancialCalculations
+    from .financial_items import CapexManager, OpexManager, ReceitasManager
+    from .project_manager import ProjectManager
+except ImportError:
+    from config import Config
+    from financial_calculations import FinancialCalculations
+    from financial_items import CapexManager, OpexManager, ReceitasManager
+    from project_manager import ProjectManager
+
+# Upper bound on project names offered by the selection dropdown; the
+# full list stays in memory, only the display is capped
+_MAX_PROJECT_MATCHES = 50
+
+# Fixed Treeview row height in pixels, shared by the style setup and
+# the virtual-window size calculation
+_TREE_ROW_HEIGHT = 22
+
+# Guards _init_style so the theme and shared styles are configured once
+# per process, not once per window
+_STYLE_INITED = False
+
+def _init_style():
+    """Apply the application theme and shared widget styles once."""
+    global _STYLE_INITED
+    if _STYLE_INITED:
+        return
+    _STYLE_INITED = True
+
+    # The labelframe padding lives in the style so the individual
+    # widgets no longer carry it; the fixed Treeview row height spares
+    # Tk from measuring row content
+    style = ttk.Style()
+    style.theme_use('clam')
+    style.configure('TLabelframe', padding=10)
+    style.configure('Treeview', rowheight=_TREE_ROW_HEIGHT)
+
+def _fmt_col(values):
+    """
+    Format a float column to two decimals in one batch call.
+
+    np.char.mod applies the format string across the whole array in C,
+    instead of a Python-level format call per cell.
+
+    Args:
+        values (numpy.ndarray): Float column to format
+
+    Returns:
+        numpy.ndarray: Array of formatted strings
+    """
+    return np.char.mod('%.2f', values)
+
+# Column spec shared by the CapEx, OpEx and Receitas tabs:
+# (identifier, heading, width)
+COLS = (
+    ('tag', 'TAG', 100),
+    ('descricao', 'Descrição', 300),
+    ('quantidade', 'Quantidade', 100),
+    ('valor_unitario', 'Valor Unitário', 100),
+    ('valor_total', 'Valor Total', 100),
+)
+
+# Shared pack() geometry for top-level blocks, so the outer margins are
+# defined once instead of repeated at every call site
+PACK = dict(padx=10, pady=5)
+
+# Static widget specs frozen at module level so the builders are plain
+# loops over data: (label, attribute name, entry width)
+_TAX_ROWS = (
+    ('Alíquota IR (%):', 'ir_rate', 10),
+    ('Alíquota CSLL (%):', 'csll_rate', 10),
+)
+_TMA_ROWS = (
+    ('TMA (%):', 'tma_rate', 10),
+)
+
+# Analysis result rows: (label, attribute name)
+_RESULT_ROWS = (
+    ('TIR:', 'tir_result'),
+    ('VPL:', 'vpl_result'),
+    ('Payback:', 'payback_result'),
+    ('Dívida Líquida/EBITDA:', 'debt_ebitda_result'),
+)
+
+class _AggregateStore:
+    """
+    In-memory SQL store for ad-hoc aggregates over the tab data.
+
+    The numeric columns of each tab are mirrored into a sqlite
+    ':memory:' table on refresh, so summaries run as one SQL aggregate
+    in C instead of a Python loop over tree rows.
+    """
+
+    def __init__(self):
+        self._db = sqlite3.connect(':memory:', check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE items (kind TEXT, tag TEXT, quantidade REAL,"
+            " valor_unitario REAL, valor_total REAL)")
+        self._db.execute("CREATE INDEX idx_items_kind ON items (kind)")
+
+    def replace(self, kind, rows):
+        """
+        Replace all rows of one kind with a fresh batch.
+
+        Args:
+            kind (str): Partition key identifying the tab
+            rows (iterable): (tag, quantidade, valor_unitario,
+                valor_total) tuples
+        """
+        self._db.execute("DELETE FROM items WHERE kind = ?", (kind,))
+        self._db.executemany(
+            "INSERT INTO items VALUES (?, ?, ?, ?, ?)",
+            ((kind,) + tuple(row) for row in rows))
+
+    def summary(self, kind):
+        """
+        Aggregate one kind's rows.
+
+        Args:
+            kind (str): Partition key identifying the tab
+
+        Returns:
+            tuple: (count, total) over the kind's valor_total column
+        """
+        return self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(valor_total), 0.0)"
+            " FROM items WHERE kind = ?", (kind,)).fetchone()
+
 class MainApplication:
     def __init__(self, root):
         self.root = root
         self.root.title("Análise de Viabilidade Econômica")
         self.root.geometry("1200x800")
+
+        # Data managers backing the item tabs
+        self.capex_manager = CapexManager()
+        self.opex_manager = OpexManager()
+        self.receitas_manager = ReceitasManager()
+        self.config = Config()
+        self.calculations = FinancialCalculations(
+            self.capex_manager, self.opex_manager,
+            self.receitas_manager, self.config)
+        self.project_manager = ProjectManager()
+
+        # Project names are read from the index on first use and cached
+        # until a project is registered
+        self._project_names = None
+
+        # Virtualized tree state: full row lists live here and only the
+        # visible window is materialized as Treeview items
+        self._tree_rows = {}
+        self._tree_offset = {}
+        self._tree_scrollbar = {}
+
+        # Item trees keyed by their tab id, used to detach the rows of
+        # whichever trees are not on the active tab, and the detached
+        # item ids per tree so reactivation can reclaim them
+        self._frame_tree = {}
+        self._tree_detached = {}
+
+        # Visible row counts measured from <Configure> events, used as
+        # the virtual window size once the trees have been laid out
+        self._tree_window = {}
+
+        # Pending after() ids for debounced handlers, keyed by name
+        self._deb = {}
+
+        # Worker pool for Excel parsing; results are marshalled back to
+        # the Tk thread with root.after, widgets are never touched here
+        self._io = ThreadPoolExecutor(max_workers=2)
+        self._progress = None
+
+        # Columnar (structure-of-arrays) views of each tab's numeric
+        # data, keyed by tree: (quantities, unit_prices, totals)
+        self._tree_cols = {}
+
+        # SQL-backed aggregates over the tab data, partitioned by tree
+        self._aggregates = _AggregateStore()
         
         # Apply theme
-        style = ttk.Style()
-        style.theme_use('clam')
-        
+        _init_style()
+
         # Create main notebook
         self.notebook = ttk.Notebook(root)
-        self.notebook.pack(expand=True, fill='both', padx=10, pady=5)
-        
-        # Initialize frames
-        self.project_frame = self.create_project_frame()
-        self.capex_frame = self.create_capex_frame()
-        self.opex_frame = self.create_opex_frame()
-        self.receitas_frame = self.create_receitas_frame()
-        self.config_frame = self.create_config_frame()
-        self.analysis_frame = self.create_analysis_frame()
+        self.notebook.pack(expand=True, fill='both', **PACK)
         
-        # Add frames to notebook
-        self.notebook.add(self.project_frame, text='Projeto')
-        self.notebook.add(self.capex_frame, text='CapEx')
-        self.notebook.add(self.opex_frame, text='OpEx')
-        self.notebook.add(self.receitas_frame, text='Receitas')
-        self.notebook.add(self.config_frame, text='Configuração')
-        self.notebook.add(self.analysis_frame, text='Análise')
-
-    def create_project_frame(self):
+        # Tabs start as empty placeholders and are populated on first
+        # visit, so startup only pays for the tab the user actually sees
+        self._builders = {}
+        self._built = set()
+
+        self.project_frame = self._add_lazy_tab('Projeto', self.create_project_frame)
+        self.capex_frame = self._add_lazy_tab('CapEx', self.create_capex_frame)
+        self.opex_frame = self._add_lazy_tab('OpEx', self.create_opex_frame)
+        self.receitas_frame = self._add_lazy_tab('Receitas', self.create_receitas_frame)
+        self.config_frame = self._add_lazy_tab('Configuração', self.create_config_frame)
+        self.analysis_frame = self._add_lazy_tab('Análise', self.create_analysis_frame)
+
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        # The initially selected tab never fires the event, build it now
+        self._on_tab_changed()
+
+    def _add_lazy_tab(self, text, builder):
+        """
+        Add a placeholder tab whose contents are built on first visit.
+
+        Args:
+            text (str): Tab label
+            builder (callable): Populates the tab frame when first shown
+
+        Returns:
+            ttk.Frame: The placeholder frame added to the notebook
+        """
         frame = ttk.Frame(self.notebook)
-        
+        self.notebook.add(frame, text=text)
+        self._builders[str(frame)] = builder
+        return frame
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on first visit and sync tree rows."""
+        tab_id = self.notebook.select()
+        if tab_id not in self._built:
+            self._built.add(tab_id)
+            self._builders[tab_id](self.notebook.nametowidget(tab_id))
+        self._sync_tree_visibility(tab_id)
+
+    def _sync_tree_visibility(self, active_tab_id):
+        """
+        Detach the rows of hidden trees and re-render the active one.
+
+        Detached items cost Tk no layout or drawing work, so only the
+        tree the user is looking at keeps live rows.
+
+        Args:
+            active_tab_id (str): Tab id of the newly selected tab
+        """
+        for frame_id, tree in self._frame_tree.items():
+            if frame_id == active_tab_id:
+                self._render_window(tree)
+            else:
+                children = tree.get_children()
+                if children:
+                    # Detached items stay alive inside Tk but leave the
+                    # root's child list, so remember their ids for the
+                    # next render to delete
+                    tree.detach(*children)
+                    self._tree_detached.setdefault(tree, []).extend(children)
+
+    def create_project_frame(self, frame):
+        # Locals resolve in one LOAD_FAST instead of a module and an
+        # attribute lookup per widget
+        Label, Entry, Button, LabelFrame = (
+            ttk.Label, ttk.Entry, ttk.Button, ttk.LabelFrame)
+
         # Project registration section
-        reg_frame = ttk.LabelFrame(frame, text="Cadastro de Projeto", padding="10")
-        reg_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(reg_frame, text="Nome do Projeto:").grid(row=0, column=0, padx=5, pady=5)
-        self.project_name = ttk.Entry(reg_frame, width=40)
+        reg_frame = LabelFrame(frame, text="Cadastro de Projeto")
+        reg_frame.pack(fill='x', **PACK)
+
+        Label(reg_frame, text="Nome do Projeto:").grid(row=0, column=0, padx=5, pady=5)
+        self.project_name = Entry(reg_frame, width=40)
         self.project_name.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(reg_frame, text="Descrição:").grid(row=1, column=0, padx=5, pady=5)
-        self.project_desc = ttk.Entry(reg_frame, width=40)
+
+        Label(reg_frame, text="Descrição:").grid(row=1, column=0, padx=5, pady=5)
+        self.project_desc = Entry(reg_frame, width=40)
         self.project_desc.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Button(reg_frame, text="Cadastrar Projeto", command=self.register_project).grid(row=2, column=1, pady=10)
-        
+
+        Button(reg_frame, text="Cadastrar Projeto", command=self.register_project).grid(row=2, column=1, pady=10)
+
         # Project selection section
-        sel_frame = ttk.LabelFrame(frame, text="Seleção de Projeto", padding="10")
-        sel_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(sel_frame, text="Projeto:").grid(row=0, column=0, padx=5, pady=5)
+        sel_frame = LabelFrame(frame, text="Seleção de Projeto")
+        sel_frame.pack(fill='x', **PACK)
+
+        Label(sel_frame, text="Projeto:").grid(row=0, column=0, padx=5, pady=5)
         self.project_select = ttk.Combobox(sel_frame, width=37)
         self.project_select.grid(row=0, column=1, padx=5, pady=5)
-        
-        return frame
+        self.project_select.bind(
+            '<<ComboboxSelected>>',
+            lambda event: self._debounce('project_select', 200, self._project_selected))
+        # Filter the dropdown as the user types, one repopulation per
+        # typing burst
+        self.project_select.bind(
+            '<KeyRelease>',
+            lambda event: self._debounce('project_filter', 250, self._filter_projects))
+        self._filter_projects()
 
-    def create_capex_frame(self):
-        frame = ttk.Frame(self.notebook)
-        
-        # Controls frame
-        controls = ttk.Frame(frame)
-        controls.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(controls, text="Adicionar Item", command=self.add_capex).pack(side='left', padx=5)
-        ttk.Button(controls, text="Importar Excel", command=self.import_capex).pack(side='left', padx=5)
-        
-        # Treeview
-        columns = ('tag', 'descricao', 'quantidade', 'valor_unitario', 'valor_total')
-        self.capex_tree = ttk.Treeview(frame, columns=columns, show='headings')
-        
-        # Define headings
-        self.capex_tree.heading('tag', text='TAG')
-        self.capex_tree.heading('descricao', text='Descrição')
-        self.capex_tree.heading('quantidade', text='Quantidade')
-        self.capex_tree.heading('valor_unitario', text='Valor Unitário')
-        self.capex_tree.heading('valor_total', text='Valor Total')
-        
-        # Define columns
-        self.capex_tree.column('tag', width=100)
-        self.capex_tree.column('descricao', width=300)
-        self.capex_tree.column('quantidade', width=100)
-        self.capex_tree.column('valor_unitario', width=100)
-        self.capex_tree.column('valor_total', width=100)
-        
-        self.capex_tree.pack(expand=True, fill='both', padx=10, pady=5)
-        
-        return frame
+    def _get_project_names(self):
+        """Get the cached project name list, reading the index once."""
+        if self._project_names is None:
+            self._project_names = self.project_manager.list_projects()
+        return self._project_names
 
-    def create_opex_frame(self):
-        frame = ttk.Frame(self.notebook)
-        
-        # Controls frame
-        controls = ttk.Frame(frame)
-        controls.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(controls, text="Adicionar Item", command=self.add_opex).pack(side='left', padx=5)
-        ttk.Button(controls, text="Importar Excel", command=self.import_opex).pack(side='left', padx=5)
-        
-        # Treeview
-        columns = ('tag', 'descricao', 'quantidade', 'valor_unitario', 'valor_total')
-        self.opex_tree = ttk.Treeview(frame, columns=columns, show='headings')
-        
-        # Define headings
-        self.opex_tree.heading('tag', text='TAG')
-        self.opex_tree.heading('descricao', text='Descrição')
-        self.opex_tree.heading('quantidade', text='Quantidade')
-        self.opex_tree.heading('valor_unitario', text='Valor Unitário')
-        self.opex_tree.heading('valor_total', text='Valor Total')
-        
-        # Define columns
-        self.opex_tree.column('tag', width=100)
-        self.opex_tree.column('descricao', width=300)
-        self.opex_tree.column('quantidade', width=100)
-        self.opex_tree.column('valor_unitario', width=100)
-        self.opex_tree.column('valor_total', width=100)
-        
-        self.opex_tree.pack(expand=True, fill='both', padx=10, pady=5)
-        
-        return frame
+    def _filter_projects(self):
+        """Repopulate the project dropdown with names matching the entry."""
+        self._deb.pop('project_filter', None)
+        typed = self.project_select.get().strip().lower()
+        names = self._get_project_names()
+        if typed:
+            names = [name for name in names if typed in name.lower()]
+        self.project_select['values'] = names[:_MAX_PROJECT_MATCHES]
+
+    def _make_item_tab(self, frame, add_command, import_command):
+        """
+        Build one item tab (controls plus virtualized tree) from COLS.
+
+        The CapEx, OpEx and Receitas tabs are structurally identical, so
+        one data-driven builder replaces three copies of the same widget
+        code.
+
+        Args:
+            frame (ttk.Frame): Tab frame to populate
+            add_command (callable): Callback for the add button
+            import_command (callable): Callback for the import button
+
+        Returns:
+            ttk.Treeview: The tab's tree
+        """
+        Frame, Button = ttk.Frame, ttk.Button
 
-    def create_receitas_frame(self):
-        frame = ttk.Frame(self.notebook)
-        
         # Controls frame
-        controls = ttk.Frame(frame)
-        controls.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Button(controls, text="Adicionar Item", command=self.add_receita).pack(side='left', padx=5)
-        ttk.Button(controls, text="Importar Excel", command=self.import_receita).pack(side='left', padx=5)
-        
-        # Treeview
-        columns = ('tag', 'descricao', 'quantidade', 'valor_unitario', 'valor_total')
-        self.receitas_tree = ttk.Treeview(frame, columns=columns, show='headings')
-        
-        # Define headings
-        self.receitas_tree.heading('tag', text='TAG')
-        self.receitas_tree.heading('descricao', text='Descrição')
-        self.receitas_tree.heading('quantidade', text='Quantidade')
-        self.receitas_tree.heading('valor_unitario', text='Valor Unitário')
-        self.receitas_tree.heading('valor_total', text='Valor Total')
-        
-        # Define columns
-        self.receitas_tree.column('tag', width=100)
-        self.receitas_tree.column('descricao', width=300)
-        self.receitas_tree.column('quantidade', width=100)
-        self.receitas_tree.column('valor_unitario', width=100)
-        self.receitas_tree.column('valor_total', width=100)
-        
-        self.receitas_tree.pack(expand=True, fill='both', padx=10, pady=5)
-        
-        return frame
+        controls = Frame(frame)
+        controls.pack(fill='x', **PACK)
 
-    def create_config_frame(self):
-        frame = ttk.Frame(self.notebook)
-        
+        Button(controls, text="Adicionar Item", command=add_command).pack(side='left', padx=5)
+        Button(controls, text="Importar Excel", command=import_command).pack(side='left', padx=5)
+
+        # Treeview; the fixed height also sizes the virtual window
+        tree = ttk.Treeview(frame, columns=[c[0] for c in COLS],
+                            show='headings', height=20)
+
+        # One Tcl eval configures every heading and column, instead of
+        # ten wrapper calls each crossing the Python/Tcl boundary
+        path = str(tree)
+        tree.tk.eval('\n'.join(
+            f'{path} heading {column} -text {{{heading}}}\n'
+            f'{path} column {column} -width {width}'
+            for column, heading, width in COLS))
+
+        self._attach_virtual_scroll(frame, tree)
+        tree.pack(expand=True, fill='both', **PACK)
+        self._frame_tree[str(frame)] = tree
+
+        return tree
+
+    def create_capex_frame(self, frame):
+        self.capex_tree = self._make_item_tab(frame, self.add_capex, self.import_capex)
+
+    def create_opex_frame(self, frame):
+        self.opex_tree = self._make_item_tab(frame, self.add_opex, self.import_opex)
+
+    def create_receitas_frame(self, frame):
+        self.receitas_tree = self._make_item_tab(frame, self.add_receita, self.import_receita)
+
+    def _grid_entries(self, parent, rows):
+        """
+        Build labelled entries from a spec table, one grid row each.
+
+        Args:
+            parent: Container widget
+            rows (tuple): (label, attribute name, width) triples
+        """
+        Label, Entry = ttk.Label, ttk.Entry
+        for row, (label, attribute, width) in enumerate(rows):
+            Label(parent, text=label).grid(row=row, column=0, padx=5, pady=5)
+            entry = Entry(parent, width=width)
+            entry.grid(row=row, column=1, padx=5, pady=5)
+            setattr(self, attribute, entry)
+
+    def create_config_frame(self, frame):
         # Tax configuration
-        tax_frame = ttk.LabelFrame(frame, text="Configurações Tributárias", padding="10")
-        tax_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(tax_frame, text="Alíquota IR (%):").grid(row=0, column=0, padx=5, pady=5)
-        self.ir_rate = ttk.Entry(tax_frame, width=10)
-        self.ir_rate.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(tax_frame, text="Alíquota CSLL (%):").grid(row=1, column=0, padx=5, pady=5)
-        self.csll_rate = ttk.Entry(tax_frame, width=10)
-        self.csll_rate.grid(row=1, column=1, padx=5, pady=5)
-        
+        tax_frame = ttk.LabelFrame(frame, text="Configurações Tributárias")
+        tax_frame.pack(fill='x', **PACK)
+        self._grid_entries(tax_frame, _TAX_ROWS)
+
         # TMA configuration
-        tma_frame = ttk.LabelFrame(frame, text="Taxa Mínima de Atratividade", padding="10")
-        tma_frame.pack(fill='x', padx=10, pady=5)
-        
-        ttk.Label(tma_frame, text="TMA (%):").grid(row=0, column=0, padx=5, pady=5)
-        self.tma_rate = ttk.Entry(tma_frame, width=10)
-        self.tma_rate.grid(row=0, column=1, padx=5, pady=5)
-        
+        tma_frame = ttk.LabelFrame(frame, text="Taxa Mínima de Atratividade")
+        tma_frame.pack(fill='x', **PACK)
+        self._grid_entries(tma_frame, _TMA_ROWS)
+        
+        # Revalidate once per typing burst instead of on every keystroke
+        for entry in (self.ir_rate, self.csll_rate, self.tma_rate):
+            entry.bind(
+                '<KeyRelease>',
+                lambda event: self._debounce('config', 300, self._config_entries_changed))
+
         # Save button
         ttk.Button(frame, text="Salvar Configurações", command=self.save_config).pack(pady=10)
-        
-        return frame
 
-    def create_analysis_frame(self):
-        frame = ttk.Frame(self.notebook)
-        
+    def create_analysis_frame(self, frame):
+        Label = ttk.Label
+
         # Results frame
-        results_frame = ttk.LabelFrame(frame, text="Resultados da Análise", padding="10")
-        results_frame.pack(fill='x', padx=10, pady=5)
-        
-        # TIR
-        ttk.Label(results_frame, text="TIR:").grid(row=0, column=0, padx=5, pady=5)
-        self.tir_result = ttk.Label(results_frame, text="--")
-        self.tir_result.grid(row=0, column=1, padx=5, pady=5)
-        
-        # VPL
-        ttk.Label(results_frame, text="VPL:").grid(row=1, column=0, padx=5, pady=5)
-        self.vpl_result = ttk.Label(results_frame, text="--")
-        self.vpl_result.grid(row=1, column=1, padx=5, pady=5)
-        
-        # Payback
-        ttk.Label(results_frame, text="Payback:").grid(row=2, column=0, padx=5, pady=5)
-        self.payback_result = ttk.Label(results_frame, text="--")
-        self.payback_result.grid(row=2, column=1, padx=5, pady=5)
-        
-        # Dívida Líquida/EBITDA
-        ttk.Label(results_frame, text="Dívida Líquida/EBITDA:").grid(row=3, column=0, padx=5, pady=5)
-        self.debt_ebitda_result = ttk.Label(results_frame, text="--")
-        self.debt_ebitda_result.grid(row=3, column=1, padx=5, pady=5)
+        results_frame = ttk.LabelFrame(frame, text="Resultados da Análise")
+        results_frame.pack(fill='x', **PACK)
+
+        for row, (label, attribute) in enumerate(_RESULT_ROWS):
+            Label(results_frame, text=label).grid(row=row, column=0, padx=5, pady=5)
+            result = Label(results_frame, text="--")
+            result.grid(row=row, column=1, padx=5, pady=5)
+            setattr(self, attribute, result)
         
         # Buttons frame
         buttons_frame = ttk.Frame(frame)
-        buttons_frame.pack(fill='x', padx=10, pady=5)
+        buttons_frame.pack(fill='x', **PACK)
         
         ttk.Button(buttons_frame, text="Calcular", command=self.calculate_analysis).pack(side='left', padx=5)
         ttk.Button(buttons_frame, text="Exportar para Excel", command=self.export_analysis).pack(side='left', padx=5)
-        
-        return frame
 
-    # Callback methods (to be implemented)
+    def _debounce(self, key, ms, fn):
+        """
+        Run fn once after ms of quiet, coalescing bursts of events.
+
+        Each call cancels the pending timer registered under key, so a
+        rapid stream of events (keystrokes, repeated selections) results
+        in a single trailing invocation.
+
+        Args:
+            key (str): Name identifying the debounced handler
+            ms (int): Quiet period in milliseconds
+            fn (callable): Handler to invoke after the quiet period
+        """
+        pending = self._deb.get(key)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._deb[key] = self.root.after(ms, fn)
+
+    def _config_entries_changed(self):
+        """Debounced validation of the config entries as the user types."""
+        self._deb.pop('config', None)
+        values = []
+        for entry in (self.ir_rate, self.csll_rate, self.tma_rate):
+            try:
+                values.append(float(entry.get().replace(',', '.')))
+            except ValueError:
+                values.append(None)
+        self._config_preview = tuple(values)
+
+    def _project_selected(self):
+        """Debounced reaction to a project selection."""
+        self._deb.pop('project_select', None)
+
+    def _bulk_insert(self, tree, rows, chunk=500):
+        """
+        Insert many rows into a Treeview with the widget unmapped.
+
+        Unpacking the tree first means Tk performs no layout or redraw
+        work per insert; everything is drawn once when the widget is
+        packed back. Batches beyond the chunk size continue through
+        after_idle callbacks so the event loop keeps pumping between
+        chunks instead of freezing for the whole insert.
+
+        Args:
+            tree (ttk.Treeview): Target tree
+            rows (iterable): Sequences of values, one per row
+            chunk (int): Rows inserted per event-loop turn
+        """
+        rows = list(rows)
+        tree.pack_forget()
+        # Call the Tcl command directly: the ttk insert wrapper rebuilds
+        # an option tuple and decodes the item id on every row, all of
+        # which is overhead when inserting thousands of rows we never
+        # need the ids of
+        path = str(tree)
+        call = tree.tk.call
+
+        def step(i):
+            for r in rows[i:i + chunk]:
+                call(path, 'insert', '', 'end', '-values', tuple(r))
+            if i + chunk < len(rows):
+                self.root.after_idle(step, i + chunk)
+            else:
+                tree.pack(expand=True, fill='both', **PACK)
+
+        step(0)
+
+    def _attach_virtual_scroll(self, frame, tree):
+        """
+        Attach a scrollbar that pages the virtual window of a tree.
+
+        Args:
+            frame (ttk.Frame): Parent frame of the tree
+            tree (ttk.Treeview): Tree to virtualize
+        """
+        scrollbar = ttk.Scrollbar(
+            frame, orient='vertical',
+            command=lambda *args, t=tree: self._on_tree_scroll(t, *args))
+        scrollbar.pack(side='right', fill='y', pady=5)
+        self._tree_scrollbar[tree] = scrollbar
+
+        # The wheel pages the virtual window too; Windows and macOS
+        # deliver <MouseWheel> deltas, X11 delivers Button-4/5
+        tree.bind('<MouseWheel>', lambda event, t=tree: self._on_tree_wheel(t, event))
+        tree.bind('<Button-4>', lambda event, t=tree: self._on_tree_wheel(t, event))
+        tree.bind('<Button-5>', lambda event, t=tree: self._on_tree_wheel(t, event))
+        # Track the laid-out height so the window size follows resizes
+        tree.bind('<Configure>', lambda event, t=tree: self._on_tree_configure(t, event))
+
+    def _window_size(self, tree):
+        """Number of rows the tree shows at once."""
+        window = self._tree_window.get(tree)
+        if window is not None:
+            return window
+        # Not laid out yet; fall back to the widget's requested height
+        return max(int(tree.cget('height')), 1)
+
+    def _on_tree_wheel(self, tree, event):
+        """Translate wheel events into virtual-window scrolling."""
+        if event.num == 4 or event.delta > 0:
+            step = -3
+        else:
+            step = 3
+        self._on_tree_scroll(tree, 'scroll', step, 'units')
+        return 'break'
+
+    def _on_tree_configure(self, tree, event):
+        """Fit the virtual window to the rows the tree can display."""
+        window = max(1, event.height // _TREE_ROW_HEIGHT)
+        if window != self._tree_window.get(tree):
+            self._tree_window[tree] = window
+            self._render_window(tree)
+
+    def _set_tree_rows(self, tree, rows):
+        """
+        Replace a tree's backing dataset and render the first window.
+
+        The full dataset stays in a plain Python list; only the rows
+        inside the visible window become Treeview items, so insert cost
+        is bounded by the window size rather than the dataset size.
+
+        Args:
+            tree (ttk.Treeview): Target tree
+            rows (iterable): Sequences of values, one per row
+        """
+        self._tree_rows[tree] = list(rows)
+        self._tree_offset[tree] = 0
+        self._render_window(tree)
+
+    def _render_window(self, tree):
+        """Rebuild the tree's items from the currently visible slice."""
+        rows = self._tree_rows.get(tree, ())
+        offset = self._tree_offset.get(tree, 0)
+        # get_children only sees attached items; items detached while
+        # the tab was hidden must be deleted by their recorded ids or
+        # they would accumulate inside Tk forever
+        detached = self._tree_detached.pop(tree, None)
+        if detached:
+            tree.delete(*detached)
+        tree.delete(*tree.get_children())
+        self._bulk_insert(tree, rows[offset:offset + self._window_size(tree)])
+        self._update_scrollbar(tree)
+
+    def _update_scrollbar(self, tree):
+        """Reflect the virtual window position on the tree's scrollbar."""
+        scrollbar = self._tree_scrollbar.get(tree)
+        if scrollbar is None:
+            return
+        total = len(self._tree_rows.get(tree, ()))
+        if total <= self._window_size(tree):
+            scrollbar.set(0.0, 1.0)
+        else:
+            offset = self._tree_offset.get(tree, 0)
+            scrollbar.set(offset / total,
+                          (offset + self._window_size(tree)) / total)
+
+    def _on_tree_scroll(self, tree, action, amount, unit=None):
+        """
+        Scrollbar callback translating scroll requests into new offsets.
+
+        Args:
+            tree (ttk.Treeview): Tree being scrolled
+            action (str): 'moveto' or 'scroll'
+            amount (str): Fraction for moveto, step count for scroll
+            unit (str, optional): 'units' or 'pages' for scroll
+        """
+        total = len(self._tree_rows.get(tree, ()))
+        window = self._window_size(tree)
+        if action == 'moveto':
+            offset = int(float(amount) * total)
+        else:
+            step = int(amount) * (window if unit == 'pages' else 1)
+            offset = self._tree_offset.get(tree, 0) + step
+        offset = max(0, min(offset, max(0, total - window)))
+        if offset != self._tree_offset.get(tree, 0):
+            self._tree_offset[tree] = offset
+            self._render_window(tree)
+
+    def _refresh_tree_from_manager(self, tree, manager):
+        """
+        Rebuild a tree's dataset from its manager as columnar arrays.
+
+        Quantities and unit prices are pulled into contiguous numpy
+        columns and the total column is computed as one vectorized
+        multiply; display rows are then assembled from the columns. The
+        columns are kept for later numeric work on the tab's data.
+
+        Args:
+            tree (ttk.Treeview): Tree to refresh
+            manager: Item manager backing the tab
+        """
+        items = manager.get_all_items()
+        count = len(items)
+        quantities = np.fromiter(
+            (item.quantity for item in items), dtype=np.float64, count=count)
+        unit_prices = np.fromiter(
+            (item.unit_price for item in items), dtype=np.float64, count=count)
+        totals = quantities * unit_prices
+        self._tree_cols[tree] = (quantities, unit_prices, totals)
+        self._aggregates.replace(
+            str(tree),
+            zip((item.tag for item in items), quantities.tolist(),
+                unit_prices.tolist(), totals.tolist()))
+
+        # Currency columns are formatted in one vectorized pass; the raw
+        # arrays above stay available for numeric work
+        rows = [
+            (item.tag, item.description, quantity, unit_price, total)
+            for item, quantity, unit_price, total in zip(
+                items, quantities.tolist(),
+                _fmt_col(unit_prices).tolist(), _fmt_col(totals).tolist())
+        ]
+        self._set_tree_rows(tree, rows)
+
+    def _show_progress(self):
+        """Show the indeterminate progress bar, creating it on first use."""
+        if self._progress is None:
+            self._progress = ttk.Progressbar(self.root, mode='indeterminate')
+        self._progress.pack(fill='x', **PACK)
+        self._progress.start(10)
+
+    def _hide_progress(self):
+        """Stop and unmap the progress bar."""
+        self._progress.stop()
+        self._progress.pack_forget()
+
+    def _import_into(self, manager, tree):
+        """
+        Import an Excel file into a manager and refresh its tree.
+
+        The workbook is parsed on a worker thread so the UI keeps
+        pumping events; the finished result is marshalled back to the
+        Tk thread before any widget is touched.
+
+        Args:
+            manager: Item manager with import_from_excel and to_rows
+            tree (ttk.Treeview): Tree displaying the manager's items
+        """
+        filepath = filedialog.askopenfilename(
+            filetypes=[("Arquivos Excel", "*.xlsx *.xls")])
+        if not filepath:
+            return
+
+        self._show_progress()
+        future = self._io.submit(manager.import_from_excel, filepath)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_import, f, manager, tree))
+
+    def _finish_import(self, future, manager, tree):
+        """
+        Apply a finished import to the UI, back on the Tk thread.
+
+        Args:
+            future (Future): Completed import task
+            manager: Item manager the file was imported into
+            tree (ttk.Treeview): Tree displaying the manager's items
+        """
+        self._hide_progress()
+        success, message = future.result()
+        if not success:
+            messagebox.showerror("Erro", message)
+            return
+
+        self._refresh_tree_from_manager(tree, manager)
+        count, total = self._aggregates.summary(str(tree))
+        messagebox.showinfo(
+            "Importação", f"{message}\nItens: {count} | Total: R$ {total:,.2f}")
+
     def register_project(self):
-        pass
+        name = self.project_name.get().strip()
+        description = self.project_desc.get().strip()
+        if not self.project_manager.create_project(name, description):
+            messagebox.showerror("Erro", "Não foi possível criar o projeto")
+            return
+
+        # Refresh the cached name list and the dropdown
+        self._project_names = None
+        self._filter_projects()
+        messagebox.showinfo("Projeto", "Projeto criado com sucesso")
 
     def add_capex(self):
         pass
 
     def import_capex(self):
-        pass
+        self._import_into(self.capex_manager, self.capex_tree)
 
     def add_opex(self):
         pass
 
     def import_opex(self):
-        pass
+        self._import_into(self.opex_manager, self.opex_tree)
 
     def add_receita(self):
         pass
 
     def import_receita(self):
-        pass
+        self._import_into(self.receitas_manager, self.receitas_tree)
+
+    def _apply_config_entries(self):
+        """
+        Push the config entry values into the Config instance.
+
+        Returns:
+            tuple: (bool, str) - (success, message)
+        """
+        if not hasattr(self, 'tma_rate'):
+            # Config tab never visited; keep the current Config values
+            return True, "Configurações atualizadas com sucesso"
+        return self.config.update(
+            tma=self.tma_rate.get() or None,
+            ir=self.ir_rate.get() or None,
+            csll=self.csll_rate.get() or None)
 
     def save_config(self):
-        pass
+        success, message = self._apply_config_entries()
+        if success:
+            messagebox.showinfo("Configuração", message)
+        else:
+            messagebox.showerror("Erro", message)
 
     def calculate_analysis(self):
-        pass
+        success, message = self._apply_config_entries()
+        if not success:
+            messagebox.showerror("Erro", message)
+            return
+
+        # The whole pipeline is vectorized: the managers hand back their
+        # 12-month numpy series and the indicators come out of array
+        # kernels, so no per-item Python loop runs on the UI thread
+        success, message, _ = self.calculations.calculate_all()
+        if not success:
+            messagebox.showerror("Erro", message)
+            return
+
+        formatted = self.calculations.format_results()
+        self.tir_result.config(text=formatted["tir"])
+        self.vpl_result.config(text=formatted["vpl"])
+        self.payback_result.config(text=formatted["payback"])
+        self.debt_ebitda_result.config(text=formatted["divida_ebitda"])
 
     def export_analysis(self):
         pass